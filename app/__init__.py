@@ -1,34 +1,36 @@
 import os
+import logging
 from flask import Flask
 from flask_cors import CORS
 from flask_migrate import Migrate
-from dotenv import load_dotenv
 from config import Config
 
 from app.api.startup_routes import startup_bp
 from app.api.admin_routes import admin_bp
 from app.models.db import db, init_db
-
-# from app.cli.scraper_commands import cli as scraper_cli
-
-load_dotenv()
+from app.utils.json_provider import OrjsonProvider
+from app.utils.query_counter import init_query_counter
 
 migrate = Migrate()
 
 
 def create_app(config_class=Config):
     """It configures the database connection, sets up routes (URLs), and other settings"""
+    # Configure logging for the application (modules only create loggers)
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
     app.config.from_object(config_class)
 
     # Initialize extensions
     db.init_app(app)
-    migrate.init_app(app, db)
+    migrate.init_app(app, db)  # Schema is applied with `flask db upgrade`
     CORS(app)
-
-    # Create database tables
-    with app.app_context():
-        db.create_all()
+    init_query_counter(app)
 
     # Register CLI commands
     from app.cli.scraper_commands import register_commands
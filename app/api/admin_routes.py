@@ -1,32 +1,43 @@
 from flask import Blueprint, request, jsonify, current_app
 from functools import wraps
 import os
+import hmac
 import logging
-import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from sqlalchemy import func
+from werkzeug.utils import import_string
 
-from app.scrapers.selenium_yc_scraper import SeleniumYCScraper
-from app.models.startup import Startup, Founder
+from app.models.startup import Startup
 from app.models.db import db
 from app.models.scraper_run import ScraperRun
+from app.utils.cache import invalidate_startup_cache
+from app.tasks import celery_app, collect_data_task, run_scraper_task
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
 # Create Blueprint
 admin_bp = Blueprint("admin", __name__)
 
+# Shared pool for background scraper runs, capping how many run at once
+_scraper_pool = ThreadPoolExecutor(
+    max_workers=int(os.getenv("SCRAPER_WORKERS", "4")), thread_name_prefix="scraper"
+)
+
+# Read once at import, compared in constant time on every request
+_API_KEY = os.getenv("API_KEY", "").encode()
+
+# Submitted scraper jobs, keyed by job id
+_scraper_jobs = {}
+MAX_TRACKED_JOBS = 100
+
 
 # API key authentication
 def require_api_key(view_function):
     @wraps(view_function)
     def decorated_function(*args, **kwargs):
-        # Get the API key from environment
-        api_key = os.getenv("API_KEY")
-
         # Get the authorization header
         auth_header = request.headers.get("Authorization")
 
@@ -40,10 +51,10 @@ def require_api_key(view_function):
             )
 
         # Extract the token
-        token = auth_header.split(" ")[1]
+        token = auth_header.split(" ", 1)[1].encode()
 
-        # Check if the token matches
-        if token != api_key:
+        # Check if the token matches (an unset API key never matches)
+        if not _API_KEY or not hmac.compare_digest(token, _API_KEY):
             return jsonify({"error": "Unauthorized - Invalid API key"}), 401
 
         # If everything checks out, proceed to the route
@@ -52,87 +63,172 @@ def require_api_key(view_function):
     return decorated_function
 
 
-# Scraper functions mapped to their names
+# Scraper classes mapped to their names, imported on first use so the API
+# does not load Selenium until a scraper actually runs
 scraper_map = {
-    "yc": SeleniumYCScraper,
+    "yc": "app.scrapers.selenium_yc_scraper:SeleniumYCScraper",
     # Add other scrapers as they are implemented
     # 'neo': NeoScraper,
     # 'techstars': TechStarsScraper,
 }
 
 
-def run_scraper(scraper_name, year=None):
-    """Run a specific scraper in a separate thread"""
+def execute_scraper(scraper_name, year=None, task_id=None):
+    """
+    Run a scraper and save its results, raising on failure
+
+    Must be called inside an app context.
+
+    Args:
+        scraper_name (str): Key of the scraper in the scraper map
+        year (int, optional): Filter startups by year
+        task_id (str, optional): Id of the queued task, stored on the scraper run
+
+    Returns:
+        int: Number of startups processed
+    """
+    # Get the correct scraper class
+    if scraper_name not in scraper_map:
+        raise ValueError(f"Unknown scraper: {scraper_name}")
+
+    # Initialize the scraper
+    scraper_class = import_string(scraper_map[scraper_name])
+    scraper = scraper_class()
+    scraper.task_id = task_id
+
+    # Fetch startups
+    startups = scraper.fetch_startups(year)
+
+    # Save all startups in a single transaction, unless the scraper already
+    # saved them while fetching (saving them again could match other rows)
+    if not scraper.saves_startups:
+        scraper.persist(startups)
+    invalidate_startup_cache()
+
+    logger.info(
+        f"Completed scraper: {scraper_name}. Processed {len(startups)} startups."
+    )
+    return len(startups)
+
+
+def run_scraper(app, scraper_name, year=None, task_id=None):
+    """Run a specific scraper on a worker thread of the scraper pool"""
     logger.info(
         f"Starting scraper: {scraper_name}" + (f" for year {year}" if year else "")
     )
 
-    # Create Flask app context
-    with current_app.app_context():
+    # Create Flask app context (current_app is not available on pool threads)
+    with app.app_context():
         try:
-            # Get the correct scraper class
-            if scraper_name not in scraper_map:
-                logger.error(f"Unknown scraper: {scraper_name}")
-                return
-
-            # Initialize the scraper
-            scraper_class = scraper_map[scraper_name]
-            scraper = scraper_class()
-
-            # Fetch startups
-            startups = scraper.fetch_startups(year)
-
-            # Process and save each startup
-            for startup_data in startups:
-                # Extract founders data
-                founders_data = startup_data.pop("founders", [])
-
-                # Check if startup exists
-                existing_startup = Startup.query.filter_by(
-                    name=startup_data["name"], year_founded=startup_data["year_founded"]
-                ).first()
-
-                if existing_startup:
-                    # Update existing startup
-                    for key, value in startup_data.items():
-                        setattr(existing_startup, key, value)
-                    startup = existing_startup
-                else:
-                    # Create new startup
-                    startup = Startup(**startup_data)
-                    db.session.add(startup)
-
-                # Need to flush to get the startup ID
-                db.session.flush()
-
-                # Process founders
-                for founder_data in founders_data:
-                    # Check if founder exists
-                    existing_founder = Founder.query.filter_by(
-                        name=founder_data["name"], startup_id=startup.id
-                    ).first()
-
-                    if existing_founder:
-                        # Update existing founder
-                        for key, value in founder_data.items():
-                            setattr(existing_founder, key, value)
-                    else:
-                        # Create new founder
-                        founder = Founder(**founder_data)
-                        founder.startup_id = startup.id
-                        db.session.add(founder)
-
-                db.session.commit()
-
-            logger.info(
-                f"Completed scraper: {scraper_name}. Processed {len(startups)} startups."
-            )
-
+            execute_scraper(scraper_name, year, task_id=task_id)
         except Exception as e:
             logger.error(f"Error in scraper {scraper_name}: {str(e)}")
             db.session.rollback()
 
 
+def execute_collection(source, year=None, force=False, task_id=None):
+    """
+    Run the data collection for a source, or for all of them
+
+    Must be called inside an app context.
+
+    Args:
+        source (str): "YC", "Neo", "TechStars" or "all"
+        year (int, optional): Filter startups by year
+        force (bool): Collect even if a recent update exists
+        task_id (str, optional): Id of the queued task, stored on the scraper run
+
+    Returns:
+        dict: Number of startups processed and the sources processed
+    """
+    # Import here to avoid circular imports
+    from scripts.collect_data import COLLECTORS, collect_sources
+
+    # Sources of "all" are collected concurrently
+    sources = list(COLLECTORS) if source == "all" else [source]
+    counts = collect_sources(sources, year, force, task_id=task_id)
+
+    result = {
+        "startups_processed": sum(counts.values()),
+        "sources_processed": sources,
+    }
+
+    logger.info(
+        f"Completed collection: {source}. Processed {result['startups_processed']} startups."
+    )
+    return result
+
+
+def run_collection(app, source, year=None, force=False, task_id=None):
+    """Run a data collection on a worker thread of the scraper pool"""
+    with app.app_context():
+        try:
+            execute_collection(source, year, force, task_id=task_id)
+        except Exception as e:
+            logger.error(f"Error collecting {source} data: {str(e)}")
+            db.session.rollback()
+
+
+def _submit_job(source, year, run, *args):
+    """
+    Queue a job on the shared pool
+
+    Args:
+        source (str): Source being scraped, for the status endpoint
+        year (int, optional): Year being scraped
+        run (callable): Called as run(app, *args, job_id) on a pool thread
+
+    Returns:
+        str: Job id that can be looked up in /scraper/status/<task_id>
+    """
+    # Forget finished jobs once the registry grows too large
+    if len(_scraper_jobs) >= MAX_TRACKED_JOBS:
+        for job_id in [k for k, v in _scraper_jobs.items() if v["future"].done()]:
+            del _scraper_jobs[job_id]
+
+    app = current_app._get_current_object()
+    job_id = uuid.uuid4().hex
+    _scraper_jobs[job_id] = {
+        "source": source,
+        "year": year,
+        "future": _scraper_pool.submit(run, app, *args, job_id),
+    }
+    return job_id
+
+
+def _submit_scraper(scraper_name, year=None):
+    """
+    Queue a scraper run on Celery when configured, otherwise on the shared pool
+
+    Returns:
+        str: Task id that can be looked up in /scraper/status/<task_id>
+    """
+    if run_scraper_task is not None:
+        return run_scraper_task.delay(scraper_name, year).id
+    return _submit_job(scraper_name, year, run_scraper, scraper_name, year)
+
+
+def _submit_collection(source, year=None, force=False):
+    """
+    Queue a data collection on Celery when configured, otherwise on the shared pool
+
+    Returns:
+        str: Task id that can be looked up in /scraper/status/<task_id>
+    """
+    if collect_data_task is not None:
+        return collect_data_task.delay(source, year, force).id
+    return _submit_job(source, year, run_collection, source, year, force)
+
+
+def _job_state(future):
+    """Describe the state of a scraper job future"""
+    if future.running():
+        return "running"
+    if not future.done():
+        return "pending"
+    return "failed" if future.exception() else "finished"
+
+
 @admin_bp.route("/scrape", methods=["POST"])
 @require_api_key
 def trigger_scrape():
@@ -160,11 +256,10 @@ def trigger_scrape():
         )
 
     if source == "all":
-        # Start all scrapers in separate threads
-        for scraper_name in scraper_map.keys():
-            thread = threading.Thread(target=run_scraper, args=(scraper_name, year))
-            thread.daemon = True
-            thread.start()
+        # Queue all scrapers on the scraper pool
+        job_ids = [
+            _submit_scraper(scraper_name, year) for scraper_name in scraper_map.keys()
+        ]
 
         return (
             jsonify(
@@ -172,15 +267,14 @@ def trigger_scrape():
                     "message": f"All scrapers started. Results will be processed asynchronously.",
                     "sources": list(scraper_map.keys()),
                     "year": year,
+                    "job_ids": job_ids,
                 }
             ),
             202,
         )
     else:
-        # Start specific scraper in a separate thread
-        thread = threading.Thread(target=run_scraper, args=(source, year))
-        thread.daemon = True
-        thread.start()
+        # Queue specific scraper on the scraper pool
+        job_id = _submit_scraper(source, year)
 
         return (
             jsonify(
@@ -188,12 +282,30 @@ def trigger_scrape():
                     "message": f"Scraper {source} started. Results will be processed asynchronously.",
                     "source": source,
                     "year": year,
+                    "job_id": job_id,
                 }
             ),
             202,
         )
 
 
+def _serialize_run(run):
+    """Format a scraper run record for a JSON response"""
+    return {
+        "id": run.id,
+        "task_id": run.task_id,
+        "source": run.source,
+        "start_time": run.start_time.isoformat() if run.start_time else None,
+        "end_time": run.end_time.isoformat() if run.end_time else None,
+        "status": run.status,
+        "startups_added": run.startups_added,
+        "startups_updated": run.startups_updated,
+        "startups_unchanged": run.startups_unchanged,
+        "total_processed": run.total_processed,
+        "error_message": run.error_message,
+    }
+
+
 @admin_bp.route("/scraper/status", methods=["GET"])
 def get_scraper_status():
     """Get status of scraper runs"""
@@ -202,47 +314,81 @@ def get_scraper_status():
     )
 
     # Format the response
-    runs = []
-    for run in scraper_runs:
-        runs.append(
-            {
-                "id": run.id,
-                "source": run.source,
-                "start_time": run.start_time.isoformat() if run.start_time else None,
-                "end_time": run.end_time.isoformat() if run.end_time else None,
-                "status": run.status,
-                "startups_added": run.startups_added,
-                "startups_updated": run.startups_updated,
-                "startups_unchanged": run.startups_unchanged,
-                "total_processed": run.total_processed,
-                "error_message": run.error_message,
-            }
-        )
+    runs = [_serialize_run(run) for run in scraper_runs]
 
-    # Get counts per source
+    # Get counts and last successful run per source, one grouped query each
     source_counts = {}
     sources = ["YC", "Neo", "TechStars"]
 
+    counts = dict(
+        db.session.query(Startup.source, func.count(Startup.id))
+        .filter(Startup.source.in_(sources))
+        .group_by(Startup.source)
+        .all()
+    )
+    last_runs = dict(
+        db.session.query(ScraperRun.source, func.max(ScraperRun.end_time))
+        .filter(ScraperRun.source.in_(sources), ScraperRun.status == "success")
+        .group_by(ScraperRun.source)
+        .all()
+    )
+
     for source in sources:
-        count = Startup.query.filter_by(source=source).count()
-        source_counts[source] = count
-
-        # Get last successful run
-        last_run = (
-            ScraperRun.query.filter_by(source=source, status="success")
-            .order_by(ScraperRun.end_time.desc())
-            .first()
-        )
+        source_counts[source] = counts.get(source, 0)
 
-        if last_run and last_run.end_time:
-            days_since = (datetime.utcnow() - last_run.end_time).days
+        last_update = last_runs.get(source)
+        if last_update:
+            days_since = (datetime.utcnow() - last_update).days
             source_counts[f"{source}_last_update"] = days_since
         else:
             source_counts[f"{source}_last_update"] = None
 
+    # Jobs queued on the scraper pool by this process (empty when using Celery)
+    jobs = {
+        job_id: {
+            "source": job["source"],
+            "year": job["year"],
+            "state": _job_state(job["future"]),
+        }
+        for job_id, job in _scraper_jobs.items()
+    }
+
+    return (
+        jsonify(
+            {
+                "status": "success",
+                "recent_runs": runs,
+                "source_counts": source_counts,
+                "jobs": jobs,
+            }
+        ),
+        200,
+    )
+
+
+@admin_bp.route("/scraper/status/<task_id>", methods=["GET"])
+def get_scraper_task_status(task_id):
+    """Get the state of a queued scraper task and the run it recorded"""
+    if task_id in _scraper_jobs:
+        state = _job_state(_scraper_jobs[task_id]["future"])
+    elif celery_app is not None:
+        state = celery_app.AsyncResult(task_id).state
+    else:
+        return jsonify({"error": f"Unknown task: {task_id}"}), 404
+
+    run = (
+        ScraperRun.query.filter_by(task_id=task_id)
+        .order_by(ScraperRun.start_time.desc())
+        .first()
+    )
+
     return (
         jsonify(
-            {"status": "success", "recent_runs": runs, "source_counts": source_counts}
+            {
+                "task_id": task_id,
+                "state": state,
+                "run": _serialize_run(run) if run else None,
+            }
         ),
         200,
     )
@@ -264,34 +410,17 @@ def trigger_scraper_run():
             400,
         )
 
-    # This would ideally be run in a background task, but for simplicity,
-    # we'll run it directly here (this will block the API call until complete)
-    try:
-        # Import here to avoid circular imports
-        from scripts.collect_data import (
-            collect_yc_data,
-            collect_neo_data,
-            collect_techstars_data,
-        )
-
-        result = {"status": "success", "startups_processed": 0, "sources_processed": []}
+    # Queue the collection instead of blocking the request until it completes
+    task_id = _submit_collection(source, year, force)
 
-        if source == "YC" or source == "all":
-            count = collect_yc_data(year, force)
-            result["startups_processed"] += count
-            result["sources_processed"].append("YC")
-
-        if source == "Neo" or source == "all":
-            count = collect_neo_data(year, force)
-            result["startups_processed"] += count
-            result["sources_processed"].append("Neo")
-
-        if source == "TechStars" or source == "all":
-            count = collect_techstars_data(year, force)
-            result["startups_processed"] += count
-            result["sources_processed"].append("TechStars")
-
-        return jsonify(result), 200
-
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    return (
+        jsonify(
+            {
+                "message": f"Collection for {source} started. Poll /scraper/status/{task_id} for progress.",
+                "source": source,
+                "year": year,
+                "task_id": task_id,
+            }
+        ),
+        202,
+    )
@@ -1,32 +1,180 @@
-from flask import Blueprint, request, jsonify
+import math
+
+from flask import Blueprint, abort, g, request, jsonify
 from marshmallow import ValidationError
-from sqlalchemy import extract
+from sqlalchemy import extract, func, tuple_
 
 from app.models.db import db
 from app.models.startup import Startup, Founder
-from app.schemas.startup_schema import StartupSchema, FounderSchema, StartupQuerySchema
+from app.schemas.startup_schema import (
+    StartupSchema,
+    FounderSchema,
+    StartupQuerySchema,
+    serialize_startup,
+    serialize_startups,
+)
+from app.utils.cache import add_http_caching, cached, invalidate_startup_cache
+from app.utils.json_provider import json_response
 
 # Create Blueprint
 startup_bp = Blueprint("startup", __name__)
+add_http_caching(startup_bp)
 
 # Initialize schemas
 startup_schema = StartupSchema()
-startups_schema = StartupSchema(many=True)
 founder_schema = FounderSchema()
 query_schema = StartupQuerySchema()
 
+# Columns serialized by the list endpoints. Pages are fetched as plain rows,
+# skipping ORM instance state and identity map bookkeeping for every startup.
+LIST_COLUMNS = (
+    Startup.id,
+    Startup.name,
+    Startup.description,
+    Startup.year_founded,
+    Startup.url,
+    Startup.logo_url,
+    Startup.source,
+    Startup.industry,
+    Startup.created_at,
+    Startup.updated_at,
+)
+FOUNDER_COLUMNS = (
+    Founder.id,
+    Founder.name,
+    Founder.title,
+    Founder.linkedin_url,
+    Founder.twitter_url,
+    Founder.startup_id,
+    Founder.created_at,
+)
+
+
+def _load_query_params():
+    """
+    Validate the query string of a list request, once per request
+
+    The cache key builder and the view both need the parameters, so the result
+    is kept on `g` instead of running the schema twice.
+
+    Returns:
+        dict: Validated query parameters
+
+    Raises:
+        ValidationError: If the query string is invalid
+    """
+    if "query_params" not in g:
+        g.query_params = query_schema.load(request.args)
+    return dict(g.query_params)
+
+
+def _list_cache_key():
+    """
+    Build the cache key of a list request from its validated query parameters
+
+    Parameters are sorted and defaults filled in, so equivalent URLs such as
+    `?page=1&per_page=20` and no query string at all share one cache entry.
+
+    Returns:
+        str: Canonical key for the endpoint and its parameters
+    """
+    try:
+        query_params = _load_query_params()
+    except ValidationError:
+        # Invalid requests get a 400, which is never cached
+        return request.full_path
+
+    query_params.update(request.view_args or {})
+    canonical = "&".join(f"{k}={v}" for k, v in sorted(query_params.items()))
+    return f"{request.endpoint}?{canonical}"
+
+
+def _founders_by_startup(startup_ids):
+    """
+    Fetch the founders of a page of startups in one query
+
+    Args:
+        startup_ids (list): Ids of the startups on the page
+
+    Returns:
+        dict: Founder rows keyed by startup id
+    """
+    founders = {}
+    if not startup_ids:
+        return founders
+
+    rows = (
+        db.session.query(*FOUNDER_COLUMNS)
+        .filter(Founder.startup_id.in_(startup_ids))
+        .order_by(Founder.id)
+    )
+    for row in rows:
+        founders.setdefault(row.startup_id, []).append(row)
+    return founders
+
+
+def _paginate(query, query_params):
+    """
+    Fetch one page of startups ordered by year founded and id, newest first
+
+    Seeks past the `after` cursor instead of using OFFSET, so every page costs
+    the same. An explicit page number still works for older clients. The
+    total is only counted when `with_count` is set.
+
+    Args:
+        query: Filtered query of LIST_COLUMNS
+        query_params (dict): Validated query parameters
+
+    Returns:
+        dict: Serialized startups with the pagination fields
+    """
+    page = query_params.get("page", 1)
+    per_page = query_params.get("per_page", 20)
+
+    page_query = query.order_by(Startup.year_founded.desc(), Startup.id.desc())
+    if "after" in query_params:
+        after_year, after_id = map(int, query_params["after"].split("_"))
+        page_query = page_query.filter(
+            tuple_(Startup.year_founded, Startup.id) < (after_year, after_id)
+        )
+    elif page > 1:
+        page_query = page_query.offset((page - 1) * per_page)
+
+    # Fetch one extra row to know whether there is a next page
+    startups = page_query.limit(per_page + 1).all()
+    has_more = len(startups) > per_page
+    startups = startups[:per_page]
+
+    result = {
+        "startups": serialize_startups(
+            startups, _founders_by_startup([startup.id for startup in startups])
+        ),
+        "page": page,
+        "next_cursor": (
+            f"{startups[-1].year_founded}_{startups[-1].id}" if has_more else None
+        ),
+    }
+
+    if query_params.get("with_count"):
+        total = query.with_entities(func.count(Startup.id)).order_by(None).scalar()
+        result["total"] = total
+        result["pages"] = math.ceil(total / per_page)
+
+    return result
+
 
 @startup_bp.route("/startups", methods=["GET"])
+@cached(prefix="startups", key_builder=_list_cache_key)
 def get_startups():
     """Get all startups with optional filtering"""
     try:
         # Parse and validate query parameters
-        query_params = query_schema.load(request.args)
+        query_params = _load_query_params()
     except ValidationError as err:
         return jsonify({"error": err.messages}), 400
 
-    # Build the query
-    query = Startup.query
+    # Build the query, the founders of the page are loaded in one extra query
+    query = db.session.query(*LIST_COLUMNS)
 
     # Apply filters
     if "year" in query_params:
@@ -37,27 +185,17 @@ def get_startups():
         query = query.filter(Startup.industry == query_params["industry"])
 
     # Pagination
-    page = query_params.get("page", 1)
-    per_page = query_params.get("per_page", 20)
+    result = _paginate(query, query_params)
 
-    paginated_startups = query.paginate(page=page, per_page=per_page)
-
-    # Serialize the results
-    result = {
-        "startups": startups_schema.dump(paginated_startups.items),
-        "total": paginated_startups.total,
-        "pages": paginated_startups.pages,
-        "page": page,
-    }
-
-    return jsonify(result), 200
+    return json_response(result)
 
 
 @startup_bp.route("/startups/<int:id>", methods=["GET"])
+@cached(prefix="startups")
 def get_startup(id):
     """Get a specific startup by ID"""
     startup = Startup.query.get_or_404(id)
-    return jsonify(startup_schema.dump(startup)), 200
+    return json_response(serialize_startup(startup))
 
 
 @startup_bp.route("/startups", methods=["POST"])
@@ -91,9 +229,10 @@ def create_startup():
             continue
 
     db.session.commit()
+    invalidate_startup_cache()
 
     # Return the created startup with its founders
-    return jsonify(startup_schema.dump(new_startup)), 201
+    return json_response(serialize_startup(new_startup), status=201)
 
 
 @startup_bp.route("/startups/<int:id>", methods=["PUT"])
@@ -112,22 +251,26 @@ def update_startup(id):
         setattr(startup, key, value)
 
     db.session.commit()
+    invalidate_startup_cache()
 
-    return jsonify(startup_schema.dump(startup)), 200
+    return json_response(serialize_startup(startup))
 
 
 @startup_bp.route("/startups/<int:id>", methods=["DELETE"])
 def delete_startup(id):
     """Delete a startup"""
-    startup = Startup.query.get_or_404(id)
-
-    db.session.delete(startup)
+    # A single DELETE, the database removes the founders through the cascade
+    deleted = Startup.query.filter_by(id=id).delete(synchronize_session=False)
+    if not deleted:
+        abort(404)
     db.session.commit()
+    invalidate_startup_cache()
 
     return jsonify({"message": f"Startup with id {id} deleted"}), 200
 
 
 @startup_bp.route("/years", methods=["GET"])
+@cached(prefix="years", expire=3600, key_builder=lambda: "all")
 def get_years():
     """Get list of years with startups"""
     years = (
@@ -140,16 +283,17 @@ def get_years():
 
 
 @startup_bp.route("/years/<int:year>", methods=["GET"])
+@cached(prefix="startups", key_builder=_list_cache_key)
 def get_startups_by_year(year):
     """Get startups for a specific year"""
     try:
         # Parse and validate query parameters
-        query_params = query_schema.load(request.args)
+        query_params = _load_query_params()
     except ValidationError as err:
         return jsonify({"error": err.messages}), 400
 
-    # Build the query
-    query = Startup.query.filter(Startup.year_founded == year)
+    # Build the query, the founders of the page are loaded in one extra query
+    query = db.session.query(*LIST_COLUMNS).filter(Startup.year_founded == year)
 
     # Apply additional filters
     if "source" in query_params:
@@ -158,18 +302,6 @@ def get_startups_by_year(year):
         query = query.filter(Startup.industry == query_params["industry"])
 
     # Pagination
-    page = query_params.get("page", 1)
-    per_page = query_params.get("per_page", 20)
-
-    paginated_startups = query.paginate(page=page, per_page=per_page)
-
-    # Serialize the results
-    result = {
-        "year": year,
-        "startups": startups_schema.dump(paginated_startups.items),
-        "total": paginated_startups.total,
-        "pages": paginated_startups.pages,
-        "page": page,
-    }
+    result = {"year": year, **_paginate(query, query_params)}
 
-    return jsonify(result), 200
+    return json_response(result)
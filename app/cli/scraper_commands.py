@@ -1,6 +1,6 @@
 import click
 from flask.cli import with_appcontext
-from app.scrapers.selenium_yc_scraper import SeleniumYCScraper
+from sqlalchemy import text
 from app.models.db import db
 from app.models.scraper_run import ScraperRun
 from datetime import datetime, timedelta
@@ -17,22 +17,39 @@ def scraper():
 
 @scraper.command()
 @click.option("--year", type=int, help="Filter startups by year")
+@click.option(
+    "--years",
+    help="Comma-separated years to scrape, reusing the browsers (e.g. 2022,2023)",
+)
 @click.option(
     "--headless/--no-headless", default=True, help="Run browser in headless mode"
 )
 @click.option("--wait-time", type=int, default=10, help="Wait time for page loading")
 @with_appcontext
-def run(year, headless, wait_time):
+def run(year, years, headless, wait_time):
     """Run the YC scraper"""
+    # Imported here so other commands don't load Selenium
+    from app.scrapers.selenium_yc_scraper import SeleniumYCScraper
+
+    try:
+        year_list = [int(y) for y in years.split(",") if y.strip()] if years else []
+    except ValueError:
+        raise click.BadParameter("must be comma-separated years", param_hint="--years")
+    if not year_list:
+        year_list = [year]
+
+    # Browsers go back to the scraper's driver pool after each year, so later
+    # years reuse them instead of starting Chrome again
+    scraper = SeleniumYCScraper()
     try:
-        logger.info(
-            f"Starting scraper with year={year}, headless={headless}, wait_time={wait_time}"
-        )
-        scraper = SeleniumYCScraper()
-        startups = scraper.fetch_startups(
-            year=year, headless=headless, wait_time=wait_time
-        )
-        logger.info(f"Successfully scraped {len(startups)} startups")
+        for year in year_list:
+            logger.info(
+                f"Starting scraper with year={year}, headless={headless}, wait_time={wait_time}"
+            )
+            startups = scraper.fetch_startups(
+                year=year, headless=headless, wait_time=wait_time
+            )
+            logger.info(f"Successfully scraped {len(startups)} startups")
     except Exception as e:
         logger.error(f"Error running scraper: {e}")
         raise click.ClickException(str(e))
@@ -74,7 +91,13 @@ def check_runs(days):
 def clear_runs():
     """Clear all scraper run records"""
     try:
-        count = ScraperRun.query.delete()
+        if db.engine.dialect.name == "postgresql":
+            # TRUNCATE frees the table in one step and resets the id sequence
+            count = ScraperRun.query.count()
+            db.session.execute(text("TRUNCATE TABLE scraper_runs RESTART IDENTITY"))
+        else:
+            # Bulk DELETE without loading or expiring objects in the session
+            count = ScraperRun.query.delete(synchronize_session=False)
         db.session.commit()
         click.echo(f"Cleared {count} scraper run records")
     except Exception as e:
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index
 from datetime import datetime
 
 from app.models.db import db
@@ -23,8 +23,16 @@ class ScraperRun(db.Model):
     startups_unchanged = Column(Integer, default=0)
     total_processed = Column(Integer, default=0)
 
+    # Id of the queued task (Celery task or pool job) that ran the scraper
+    task_id = Column(String(50), nullable=True, index=True)
+
     # Error details
     error_message = Column(Text, nullable=True)
 
+    __table_args__ = (
+        # Covers the "last successful run per source" lookups
+        Index("ix_scraper_runs_source_status_end_time", "source", "status", "end_time"),
+    )
+
     def __repr__(self):
         return f"<ScraperRun {self.id} - {self.source} - {self.status}>"
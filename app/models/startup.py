@@ -4,11 +4,45 @@
 These models tell Flask how to store and retrieve data
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+import re
+
+from sqlalchemy import (
+    JSON,
+    Column,
+    Integer,
+    String,
+    Text,
+    DateTime,
+    ForeignKey,
+    Index,
+)
+from sqlalchemy import event, inspect
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
-from app.models.db import db
+from app.models.db import db, utcnow
+
+# YC batch like "W23" (Winter), "S22" (Summer), "F24" (Fall) or "X25" (Summer)
+_BATCH_RE = re.compile(r"[WSFX](\d{2,})")
+
+
+def _loaded_name(instance):
+    """Get the name of an instance for repr() without triggering a SELECT"""
+    if "name" in inspect(instance).unloaded:
+        return "<unloaded>"
+    return instance.name
+
+
+def year_from_batch(batch):
+    """Derive the year founded from a batch ('S20' is 2020), or the current year"""
+    match = _BATCH_RE.fullmatch(batch or "")
+    return 2000 + int(match.group(1)) if match else datetime.utcnow().year
+
+
+def _default_year_founded(context):
+    """Derive a missing year founded from the batch at INSERT time"""
+    return year_from_batch(context.get_current_parameters().get("batch"))
 
 
 class Startup(db.Model):
@@ -19,54 +53,64 @@ class Startup(db.Model):
     id = Column(Integer, primary_key=True)
     name = Column(String(100), nullable=False)
     description = Column(Text, nullable=True)
-    year_founded = Column(Integer, nullable=False)
+    # Never NULL, derived from the batch (or the current year) when not given
+    year_founded = Column(Integer, nullable=False, default=_default_year_founded)
     url = Column(String(255), nullable=True)
     logo_url = Column(String(255), nullable=True)
-    source = Column(String(50), nullable=True)  # YC, Neo, TechStars, TechCrunch
-    industry = Column(String(100), nullable=True)
+    # YC, Neo, TechStars, TechCrunch
+    source = Column(String(50), nullable=True, index=True)
+    industry = Column(String(100), nullable=True, index=True)
 
     # Additional fields
-    batch = Column(String(10), nullable=True)  # e.g., "W23", "S22"
-    status = Column(String(20), nullable=True)  # active, acquired, closed
+    batch = Column(String(8), nullable=True)  # e.g., "W23", "S22"
+    status = Column(String(10), nullable=True)  # active, acquired, closed
     location = Column(String(100), nullable=True)  # HQ city/country
-    tags = Column(String(255), nullable=True)  # Comma-separated tags/keywords
+    # Tags/keywords, a native array on Postgres (JSON list on SQLite)
+    tags = Column(ARRAY(String(64)).with_variant(JSON(), "sqlite"), nullable=True)
     team_size = Column(Integer, nullable=True)
+    # Hash of the scraped data last saved, lets the scraper skip unchanged rows
+    content_hash = Column(String(16), nullable=True)
+
+    # Timestamps are filled in by the database
+    created_at = Column(DateTime, server_default=utcnow())
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow())
+
+    # Relationships (founders are always serialized with their startup, so load
+    # them for all startups of a query in one extra SELECT ... IN). Deleting a
+    # startup leaves its founders to the ON DELETE CASCADE of the foreign key.
+    founders = relationship(
+        "Founder",
+        back_populates="startup",
+        lazy="selectin",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
+    __table_args__ = (
+        # Conflict target for the scraper's bulk upsert
+        Index("uq_startups_name_year", "name", "year_founded", unique=True),
+        # Seek index for keyset pagination (also serves year lookups)
+        Index("ix_startups_year_founded_id", "year_founded", "id"),
+        # Year listings filtered by source and/or industry
+        Index("ix_startups_year_source_industry", "year_founded", "source", "industry"),
+        # Tag filters (tags @> ARRAY[...] / = ANY(tags)), Postgres only
+        Index("ix_startups_tags_gin", "tags", postgresql_using="gin").ddl_if(
+            dialect="postgresql"
+        ),
+    )
+
+    # Fetch the database-generated timestamps in the INSERT/UPDATE itself
+    __mapper_args__ = {"eager_defaults": True}
 
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    def __repr__(self):
+        return f"<Startup {_loaded_name(self)}>"
 
-    # Relationships
-    founders = relationship("Founder", back_populates="startup")
-
-    def __init__(self, **kwargs):
-        """Custom initialization to ensure year_founded is never NULL"""
-        # Set defaults for required fields before calling parent initializer
-        if "year_founded" not in kwargs or kwargs["year_founded"] is None:
-            # Try to extract year from batch
-            batch = kwargs.get("batch", "")
-            if (
-                batch
-                and len(batch) >= 3
-                and batch[0]
-                in [
-                    "W",
-                    "S",
-                    "F",
-                    "X",
-                ]  # Include new batch prefixes F (Fall) and X (Summer)
-                and batch[1:].isdigit()
-            ):
-                # Convert batch like 'S20' to year 2020
-                kwargs["year_founded"] = 2000 + int(batch[1:])
-            else:
-                # Default to current year if no batch or invalid format
-                kwargs["year_founded"] = datetime.utcnow().year
-
-        # Call parent initializer with updated kwargs
-        super(Startup, self).__init__(**kwargs)
 
-    def __repr__(self):
-        return f"<Startup {self.name}>"
+@event.listens_for(Startup, "before_update")
+def _clear_stale_content_hash(mapper, connection, target):
+    # Any other change (e.g. an edit through the API) no longer matches the hash
+    if not inspect(target).attrs.content_hash.history.has_changes():
+        target.content_hash = None
 
 
 class Founder(db.Model):
@@ -85,11 +129,18 @@ class Founder(db.Model):
     role_type = Column(String(50), nullable=True)  # technical/non-technical
     background = Column(Text, nullable=True)  # Previous companies/education
 
-    startup_id = Column(Integer, ForeignKey("startups.id"))
-    created_at = Column(DateTime, default=datetime.utcnow)
+    startup_id = Column(
+        Integer,
+        ForeignKey("startups.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    created_at = Column(DateTime, server_default=utcnow())
 
     # Relationships
     startup = relationship("Startup", back_populates="founders")
 
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self):
-        return f"<Founder {self.name}>"
+        return f"<Founder {_loaded_name(self)}>"
@@ -1,4 +1,4 @@
-from marshmallow import Schema, fields, validate
+from marshmallow import Schema, fields, pre_load, validate
 
 
 class FounderSchema(Schema):
@@ -10,6 +10,18 @@ class FounderSchema(Schema):
     startup_id = fields.Int(dump_only=True)
     created_at = fields.DateTime(dump_only=True)
 
+    class Meta:
+        ordered = False
+        fields = (
+            "id",
+            "name",
+            "title",
+            "linkedin_url",
+            "twitter_url",
+            "startup_id",
+            "created_at",
+        )
+
 
 class StartupSchema(Schema):
     id = fields.Int(dump_only=True)
@@ -26,10 +38,103 @@ class StartupSchema(Schema):
     # Nested relationships
     founders = fields.List(fields.Nested(FounderSchema), dump_only=True)
 
+    class Meta:
+        ordered = False
+        fields = (
+            "id",
+            "name",
+            "description",
+            "year_founded",
+            "url",
+            "logo_url",
+            "source",
+            "industry",
+            "created_at",
+            "updated_at",
+            "founders",
+        )
+
 
 class StartupQuerySchema(Schema):
+    """Query string of the list endpoints, unknown parameters are rejected"""
+
     year = fields.Int()
     source = fields.Str()
     industry = fields.Str()
-    page = fields.Int(missing=1)
-    per_page = fields.Int(missing=20)
+    page = fields.Int(missing=1, validate=validate.Range(min=1))
+    per_page = fields.Int(missing=20, validate=validate.Range(min=1, max=100))
+    after = fields.Str(validate=validate.Regexp(r"^\d+_\d+$"))  # "<year>_<id>"
+    with_count = fields.Bool(missing=False)
+
+    @pre_load
+    def strip_whitespace(self, data, **kwargs):
+        return {key: value.strip() for key, value in data.items()}
+
+
+# The serializers below leave datetimes as they are, orjson encodes them as
+# ISO 8601 strings (like isoformat()) much faster than Python code can
+
+
+def serialize_founder(founder):
+    """Serialize a founder like FounderSchema, without marshmallow's overhead"""
+    return {
+        "id": founder.id,
+        "name": founder.name,
+        "title": founder.title,
+        "linkedin_url": founder.linkedin_url,
+        "twitter_url": founder.twitter_url,
+        "startup_id": founder.startup_id,
+        "created_at": founder.created_at,
+    }
+
+
+def serialize_startup(startup, founders=None):
+    """
+    Serialize a startup like StartupSchema, without marshmallow's overhead
+
+    Keep in sync with StartupSchema and FounderSchema. The result must be
+    encoded with orjson (json_response or jsonify).
+
+    Args:
+        startup: Startup instance, or a row with the same columns
+        founders (list, optional): Founders to include instead of
+            startup.founders (required for rows)
+
+    Returns:
+        dict: Startup dictionary including its founders
+    """
+    if founders is None:
+        founders = startup.founders
+    return {
+        "id": startup.id,
+        "name": startup.name,
+        "description": startup.description,
+        "year_founded": startup.year_founded,
+        "url": startup.url,
+        "logo_url": startup.logo_url,
+        "source": startup.source,
+        "industry": startup.industry,
+        "created_at": startup.created_at,
+        "updated_at": startup.updated_at,
+        "founders": [serialize_founder(founder) for founder in founders],
+    }
+
+
+def serialize_startups(startups, founders_by_startup=None):
+    """
+    Serialize startups like StartupSchema(many=True)
+
+    Args:
+        startups (list): Startup instances with founders loaded, or rows
+        founders_by_startup (dict, optional): Founders keyed by startup id,
+            required when serializing rows
+
+    Returns:
+        list: Startup dictionaries
+    """
+    if founders_by_startup is None:
+        return [serialize_startup(startup) for startup in startups]
+    return [
+        serialize_startup(startup, founders_by_startup.get(startup.id, ()))
+        for startup in startups
+    ]
@@ -1,11 +1,80 @@
+import copy
+import json
+import hashlib
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from itertools import islice
+
+import requests
+from requests.adapters import HTTPAdapter
+from sqlalchemy.dialects import postgresql, sqlite
+from urllib3.util.retry import Retry
+
+from app.models.db import db, utcnow
+from app.models.startup import Startup, Founder, year_from_batch
+
+# Maximum number of processed records kept in memory
+PROCESS_CACHE_SIZE = 50_000
+
+# Rows sent per bulk INSERT when persisting scraped startups
+PERSIST_CHUNK_SIZE = 500
+
+# Startup columns written by the bulk upsert, the rest are set by the database
+UPSERT_COLUMNS = [
+    column.name
+    for column in Startup.__table__.columns
+    if column.name not in ("id", "created_at", "updated_at")
+]
+
+# Scrapers writing to the database at once, so concurrent runs cannot take
+# every pooled connection away from API requests
+PERSIST_CONCURRENCY = 4
+
+# Pooled connections per host, and concurrent HTTP requests across all scrapers
+HTTP_POOL_SIZE = 32
+HTTP_CONCURRENCY = 8
+HTTP_TIMEOUT = 30
+
+
+def _make_session():
+    """Create an HTTP session with keep-alive connection pooling and retries"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_SIZE,
+        pool_maxsize=HTTP_POOL_SIZE,
+        max_retries=Retry(
+            total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504)
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 
 class BaseScraper(ABC):
     """Abstract base class for all startup data scrapers"""
 
+    # Processed records shared by every scraper in the process (LRU), keyed by
+    # source and a hash of the raw record
+    _process_cache = OrderedDict()
+    _process_cache_lock = threading.Lock()
+
+    # HTTP session shared by every scraper in the process, so repeated requests
+    # to a host reuse open connections instead of a new TCP and TLS handshake
+    _session = _make_session()
+    _http_slots = threading.BoundedSemaphore(HTTP_CONCURRENCY)
+
+    # Held around database writes, bulk ones should go through persist()
+    _db_writes = threading.BoundedSemaphore(PERSIST_CONCURRENCY)
+
+    # Whether fetch_startups() saves the startups itself, so the startups it
+    # returns must not be passed to persist() again
+    saves_startups = False
+
     def __init__(self):
         self.source_name = None
+        self.task_id = None  # Set when run as a queued task
 
     @abstractmethod
     def fetch_startups(self, year=None):
@@ -33,6 +102,176 @@ class BaseScraper(ABC):
         """
         pass
 
+    def http_get(self, url, **kwargs):
+        """
+        GET a URL through the shared session
+
+        At most HTTP_CONCURRENCY requests run at once across all scrapers, to
+        stay polite to the sources.
+
+        Args:
+            url (str): URL to fetch
+            **kwargs: Passed on to requests, e.g. params or headers
+
+        Returns:
+            requests.Response: The response, raising for error statuses
+        """
+        kwargs.setdefault("timeout", HTTP_TIMEOUT)
+        with self._http_slots:
+            response = self._session.get(url, **kwargs)
+        response.raise_for_status()
+        return response
+
+    def process_startup_data_cached(self, raw_data):
+        """
+        Process raw startup data, reusing the result for a record seen before
+
+        Most records are unchanged between scrapes, so repeated runs in the
+        same process skip the parsing and cleanup of those records.
+
+        Args:
+            raw_data (dict): Raw data from the source
+
+        Returns:
+            dict: Processed startup data, a copy the caller may modify
+        """
+        key = (self.source_name, self._raw_data_key(raw_data))
+
+        with self._process_cache_lock:
+            processed = self._process_cache.get(key)
+            if processed is not None:
+                self._process_cache.move_to_end(key)
+
+        if processed is None:
+            processed = self.process_startup_data(raw_data)
+            with self._process_cache_lock:
+                self._process_cache[key] = copy.deepcopy(processed)
+                if len(self._process_cache) > PROCESS_CACHE_SIZE:
+                    self._process_cache.popitem(last=False)
+            return processed
+
+        return copy.deepcopy(processed)
+
+    @staticmethod
+    def _raw_data_key(raw_data):
+        """Hash a raw record independently of its key order"""
+        canonical = json.dumps(raw_data, sort_keys=True, default=str)
+        return hashlib.sha1(canonical.encode()).digest()
+
+    @staticmethod
+    def _content_hash(startup_data):
+        """
+        Hash processed startup data, including its founders
+
+        Stored on saved startups so a later scrape of the same data can be
+        recognized as unchanged without comparing every field.
+
+        Args:
+            startup_data (dict): Processed startup data
+
+        Returns:
+            str: 16 hex characters
+        """
+        canonical = json.dumps(startup_data, sort_keys=True, default=str)
+        return hashlib.blake2b(canonical.encode(), digest_size=8).hexdigest()
+
+    def persist(self, startups):
+        """
+        Insert or update scraped startups and their founders in bulk
+
+        Rows are written in chunks of PERSIST_CHUNK_SIZE, each with one
+        INSERT ... ON CONFLICT statement for the startups and bulk mappings
+        for their founders, and committed in a single transaction. At most
+        PERSIST_CONCURRENCY scrapers persist at the same time.
+
+        Args:
+            startups (iterable): Startup dictionaries as returned by a scraper
+        """
+        startups = iter(startups)
+        with self._db_writes:
+            while chunk := list(islice(startups, PERSIST_CHUNK_SIZE)):
+                self._persist_chunk(chunk)
+            db.session.commit()
+
+    @staticmethod
+    def _upsert_insert(table):
+        """Get a dialect-specific INSERT construct that supports ON CONFLICT"""
+        if db.engine.dialect.name == "postgresql":
+            return postgresql.insert(table)
+        return sqlite.insert(table)
+
+    def _persist_chunk(self, startups):
+        """Upsert one chunk of startups and write their founders"""
+        # Split founders off the startup rows, de-duplicating on the conflict key
+        # (the same key may not be affected twice by one upsert statement)
+        rows = {}
+        founders_by_key = {}
+        for startup_data in startups:
+            # Every row of a statement needs the same columns, missing ones
+            # default to NULL (and a missing year founded to the batch year)
+            row = {column: startup_data.get(column) for column in UPSERT_COLUMNS}
+            row["content_hash"] = self._content_hash(startup_data)
+            row["source"] = row["source"] or self.source_name
+            if row["year_founded"] is None:
+                row["year_founded"] = year_from_batch(row["batch"])
+
+            # A conflict only updates the fields the row supplied, the others
+            # keep their saved values
+            updated = frozenset(
+                column
+                for column in startup_data
+                if column in row and column not in ("name", "year_founded")
+            )
+
+            key = (row["name"], row["year_founded"])
+            founders_by_key[key] = startup_data.get("founders") or []
+            rows[key] = (updated, row)
+
+        # One upsert per set of updated fields, usually one for the whole chunk
+        rows_by_update = {}
+        for updated, row in rows.values():
+            rows_by_update.setdefault(updated, []).append(row)
+
+        startup_ids = {}
+        for updated, update_rows in rows_by_update.items():
+            stmt = self._upsert_insert(Startup.__table__)
+            update_columns = {column: stmt.excluded[column] for column in updated}
+            update_columns["content_hash"] = stmt.excluded["content_hash"]
+            update_columns["updated_at"] = utcnow()
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["name", "year_founded"], set_=update_columns
+            ).returning(Startup.id, Startup.name, Startup.year_founded)
+
+            result = db.session.execute(stmt, update_rows)
+            startup_ids.update(((row.name, row.year_founded), row.id) for row in result)
+
+        # Preload the ids of existing founders of every upserted startup in one query
+        existing_founders = {
+            (startup_id, name): founder_id
+            for founder_id, startup_id, name in Founder.query.with_entities(
+                Founder.id, Founder.startup_id, Founder.name
+            ).filter(Founder.startup_id.in_(startup_ids.values()))
+        }
+
+        # Split founders into plain insert and update mappings
+        new_founders = []
+        updated_founders = []
+        for key, founders_data in founders_by_key.items():
+            startup_id = startup_ids[key]
+            for founder_data in founders_data:
+                founder_id = existing_founders.get((startup_id, founder_data["name"]))
+
+                if founder_id:
+                    updated_founders.append(dict(founder_data, id=founder_id))
+                else:
+                    new_founders.append(dict(founder_data, startup_id=startup_id))
+
+        # Write both without building ORM instances or going through the unit of work
+        if new_founders:
+            db.session.bulk_insert_mappings(Founder, new_founders)
+        if updated_founders:
+            db.session.bulk_update_mappings(Founder, updated_founders)
+
     def get_source_name(self):
         """Get the name of the data source"""
         return self.source_name
@@ -1,11 +1,20 @@
+import os
 import re
 import time
+import queue
+import atexit
 import logging
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 
 import traceback
 from datetime import datetime
 
+from flask import current_app
+from sqlalchemy import and_, func, or_, tuple_
+
 # Selenium imports
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
@@ -15,21 +24,459 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
 
-from app.scrapers.base_scraper import BaseScraper
+from app.scrapers.base_scraper import PERSIST_CHUNK_SIZE, BaseScraper
 from app.models.startup import Startup, Founder
 from app.models.db import db
+from app.utils.cache import LRUCache, invalidate_startup_cache
 from app.utils.scraper_utils import create_scraper_run, complete_scraper_run
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
+# Seconds known locations are reused while the startups table is unchanged
+LOCATION_CACHE_TTL = 300
+
+# YC batches scraped at the same time, each in its own browser
+BATCH_WORKERS = int(os.getenv("SCRAPER_BATCH_WORKERS", "4"))
+
+# Idle browsers kept warm between scrapes, per headless mode
+DRIVER_POOL_SIZE = int(os.getenv("SELENIUM_DRIVER_POOL_SIZE", "4"))
+
+# Algolia index behind the YC company directory. The search key is public (the
+# directory page sends it to every visitor) but rotates, so it is configured
+# rather than hardcoded. Without it batches are scraped with the browser.
+YC_ALGOLIA_APP_ID = os.getenv("YC_ALGOLIA_APP_ID", "45BWZJ1SGC")
+YC_ALGOLIA_API_KEY = os.getenv("YC_ALGOLIA_API_KEY")
+YC_ALGOLIA_INDEX = os.getenv("YC_ALGOLIA_INDEX", "YCCompany_production")
+ALGOLIA_HITS_PER_PAGE = 1000
+
+# Batch code prefixes and the seasons the directory spells them out as,
+# e.g. "W22" is "Winter 2022"
+BATCH_SEASONS = {"W": "Winter", "S": "Summer", "X": "Spring", "F": "Fall"}
+BATCH_PREFIXES = {season: prefix for prefix, season in BATCH_SEASONS.items()}
+
+# Location checks remembered per scraper, the same lines are validated repeatedly
+LOCATION_MEMO_SIZE = 4096
+
+# Elements that may hold a location, looked up once per page
+LOCATION_ELEMENT_XPATHS = (
+    '//div[contains(@class, "location")]',
+    '//span[contains(@class, "location")]',
+    '//div[contains(text(), "Location:")]/following-sibling::div',
+    '//span[contains(text(), "location:")]/following-sibling::span',
+)
+
+# Selectors for company links, the first one matching anything is used
+COMPANY_LINK_SELECTORS = (
+    'a[class*="_company_"]',
+    'a[href^="/companies/"]',
+    'div[class*="rightCol"] a',
+    'div[class*="company-card"] a',
+    'div[class*="CompanyCard"] a',
+)
+
+# Company links the page is waited for, and how often (seconds) and for how
+# many unchanged polls their count is checked before the page counts as loaded
+COMPANY_LINK_CSS = 'a[class*="_company_"], a[href^="/companies/"]'
+LINK_COUNT_POLL_INTERVAL = 0.25
+LINK_COUNT_STABLE_POLLS = 2
+
+# Reads the company links (text, href and logo) and the texts of the location
+# elements of a companies page. Called with the link selectors and the
+# location XPaths. innerText keeps the line breaks of the rendered card that
+# the parsing relies on, textContent is only the fallback for links that
+# render no text.
+READ_COMPANIES_JS = """
+const [selectors, locationXPaths] = arguments;
+const logoSelector =
+  'img[src*="bookface-images.s3"], img[src*="logo"], img[src*="Logo"]';
+let selector = null;
+let links = [];
+for (const candidate of selectors) {
+  links = Array.from(document.querySelectorAll(candidate));
+  if (links.length) {
+    selector = candidate;
+    break;
+  }
+}
+const locations = [];
+for (const xpath of locationXPaths) {
+  const node = document.evaluate(
+    xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+  ).singleNodeValue;
+  if (node) locations.push((node.innerText || "").trim());
+}
+return {
+  selector: selector,
+  links: links.map((a) => {
+    const logo = a.querySelector(logoSelector);
+    return {
+      text: (a.innerText.trim() || a.textContent || "").trim(),
+      href: a.href || "",
+      logo: (logo && logo.src) || "",
+    };
+  }),
+  locations: locations,
+};
+"""
+
+# Name patterns of _verify_company_location_separation(), compiled once
+AI_CITY_RE = re.compile(r"([A-Za-z]+)AI([A-Z][a-z]+(?:\s[A-Z][a-z]+)*)")
+MULTI_WORD_NAME_RE = re.compile(r"([A-Za-z]+\s+[A-Za-z]+)([A-Z][a-z]+)")
+REGION_SUFFIX_PATTERNS = [
+    (re.compile(r"(\w+)(" + re.escape(region) + r")$"), region)
+    for region in ["USA", "EU", "UK", "UAE", "HK"]
+]
+TECH_SUFFIX_PATTERNS = [
+    (re.compile(r"([A-Za-z]+\s*)(" + re.escape(suffix) + r")([A-Z][a-z]+)"), suffix)
+    for suffix in ["Bio", "Health", "Tech", "AI", "Labs", "Med"]
+]
+# Cities with accents, with their decomposed (NFD) forms
+INTERNATIONAL_CITIES = [
+    (city, unicodedata.normalize("NFD", city))
+    for city in ["São Paulo", "México", "Bogotá", "Montréal"]
+]
+# Patterns used to clean and split extracted names, compiled once instead of
+# on every company
+BATCH_CODE_RE = re.compile(r"([WSFX]\d{2})")
+HTML_TAG_RE = re.compile(r"<[^<]+?>")
+MARKDOWN_LINK_RE = re.compile(r"\[.*?\]")
+CAPS_ACCENT_BOUNDARY_RE = re.compile(r"([A-Z][A-Z]+)([À-ÿ][a-zÀ-ÿ]+)")
+LETTER_ACCENT_BOUNDARY_RE = re.compile(r"([A-Za-z])([À-ÿ])")
+LOWER_ACCENT_UPPER_BOUNDARY_RE = re.compile(r"([a-z])([À-ÿ][A-Z])")
+CAMEL_CASE_BOUNDARY_RE = re.compile(r"([a-z])([A-Z])")
+# Separators between a name and a location, in the order they are tried
+NAME_SEPARATORS = (",", "-", "|", ":", ";", "•")
+NAME_SEPARATOR_RE = re.compile(r"[,\-|:;•]")
+LATAM_CITY_PATTERNS = [
+    (re.compile(re.escape(city), re.IGNORECASE), city)
+    for city in ["São Paulo", "México City", "Bogotá", "CDMX", "Rio de Janeiro"]
+]
+WORD_CHAR_RE = re.compile(r"\w")
+# Last ASCII character before a non-ASCII one, found in one regex scan
+# instead of comparing ord() of every pair of characters
+ASCII_BOUNDARY_RE = re.compile(r"[\x00-\x7f](?=[^\x00-\x7f])")
+
+# Location patterns, compiled once instead of on every validated line
+US_ZIP_RE = re.compile(r"\b\d{5}(?:-\d{4})?\b")
+CA_POSTAL_RE = re.compile(r"\b[A-Z]\d[A-Z] \d[A-Z]\d\b")
+POSTAL_CITY_RE = re.compile(r"\d{4,6}\s+[A-Z][a-z]+")
+# Accented letters, checked with a set test rather than a regex search
+ACCENT_CHARS = frozenset("àáâãäåçèéêëìíîïñòóôõöùúûüýÿ")
+ACCENT_LOC_RE = re.compile(r"[A-Z][a-zàáâãäåçèéêëìíîïñòóôõöùúûüýÿ]+,?\s")
+# Characters at least one of LOCATION_PATTERNS needs to match
+LOCATION_HINT_RE = re.compile(r"[,(\d]")
+LOCATION_PATTERNS = [
+    re.compile(pattern)
+    for pattern in [
+        # City, State, Country (US format)
+        r"([A-Z][a-zÀ-ÿ]+(?:[\s-][A-Z][a-zÀ-ÿ]+)*),\s*([A-Z]{2}|[A-Za-zÀ-ÿ ]+),\s*([A-Za-zÀ-ÿ ]+)",
+        # City, State/Country
+        r"([A-Z][a-zÀ-ÿ]+(?:[\s-][A-Z][a-zÀ-ÿ]+)*),\s*([A-Z]{2}|[A-Za-zÀ-ÿ ]+)",
+        # City, Country
+        r"([A-Z][a-zÀ-ÿ]+(?:[\s-][A-Z][a-zÀ-ÿ]+)*),\s*([A-Za-zÀ-ÿ ]+)",
+        # Country (Region) format - common in Asia
+        r"([A-Za-zÀ-ÿ ]+)\s*\(([A-Za-zÀ-ÿ ]+)\)",
+        # Postal code city format (Europe)
+        r"(\d{4,6})\s+([A-Z][a-zÀ-ÿ]+(?:[\s-][A-Z][a-zÀ-ÿ]+)*)",
+    ]
+]
+
+# ALL CAPS terms of departments and business units, which are not locations
+DEPARTMENT_TERMS = frozenset(
+    [
+        "ENGINEERING",
+        "PRODUCT",
+        "DESIGN",
+        "MARKETING",
+        "SALES",
+        "CUSTOMER",
+        "SUPPORT",
+        "FINANCE",
+        "HR",
+        "OPERATIONS",
+        "TALENT",
+        "TECH",
+        "TEAM",
+        "DEPARTMENT",
+        "DIVISION",
+        "MANAGEMENT",
+        "STAFF",
+        "LEADERSHIP",
+        "CENTER",
+        "GROUP",
+        "DIRECTOR",
+        "HEAD",
+        "VP",
+        "CHIEF",
+        "EXECUTIVE",
+    ]
+)
+
+# Words and phrases of company descriptions, lowercased for substring matching
+DESCRIPTION_PHRASES = frozenset(
+    [
+        "platform",
+        "software",
+        "marketplace",
+        "solution",
+        "service",
+        "app",
+        "api",
+        "for",
+        "that",
+        "helps",
+        "enables",
+        "empowers",
+        "building",
+        "powered by",
+        "industry",
+        "businesses",
+        "product",
+        "technology",
+        "the",
+        "your",
+        "provides",
+        "offering",
+    ]
+)
+
+
+# Lowercase words common in location names, each adds to a location's score
+LOCATION_WORDS = ("city", "san", "new", "los", "bay", "north", "south", "east", "west")
+
+# Lowercase phrases that rule out a line as a location
+DISQUALIFYING_PHRASES = (
+    "platform for",
+    "software for",
+    "marketplace for",
+    "solution for",
+    "the future of",
+    "service for",
+    "helps",
+    "enables",
+    "building",
+    "powered by",
+    "industry",
+    "for businesses",
+    "for enterprises",
+)
+
+# Combining marks (accents) of the Basic Multilingual Plane, removed in one C
+# level pass instead of checking every character in Python
+COMBINING_MARK_RE = re.compile(
+    "["
+    + "".join(
+        re.escape(chr(c)) for c in range(0x10000) if unicodedata.combining(chr(c))
+    )
+    + "]"
+)
+
+
+def _nfd(text):
+    """NFD normalize text, ASCII text is already normalized and returned as-is"""
+    return text if text.isascii() else unicodedata.normalize("NFD", text)
+
+
+def strip_accents(text):
+    """Remove accents from text ('Bogotá' becomes 'Bogota')"""
+    if text.isascii():
+        return text
+    return COMBINING_MARK_RE.sub("", unicodedata.normalize("NFD", text))
+
+
+def _build_trie(words, fold=False):
+    """
+    Build a character trie for longest-match lookups of words
+
+    Args:
+        words (iterable): Words to add
+        fold (bool): Key the trie on the lowercased words
+
+    Returns:
+        dict: Nested dicts keyed by character, the None key of a node holds
+            the word ending there
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word.lower() if fold else word:
+            node = node.setdefault(char, {})
+        node[None] = word
+    return trie
+
+
+def _nfd_prefix(text, normalized_text, end):
+    """
+    Get the part of a text before a position of its NFD normalized form
+
+    Decomposing accents makes the normalized text longer, so its positions
+    are past the same characters of the text once an accent comes before them.
+
+    Args:
+        text (str): Original text
+        normalized_text (str): NFD normalized text
+        end (int): Position in the normalized text
+
+    Returns:
+        str: Prefix of the original text
+    """
+    if len(normalized_text) == len(text):
+        return text[:end]
+    return unicodedata.normalize("NFC", normalized_text[:end])
+
+
+@lru_cache(maxsize=LOCATION_MEMO_SIZE)
+def _trailing_location_re(location):
+    """Compile the pattern matching a location (and separators) ending a name"""
+    return re.compile(r"[,\s]*" + re.escape(location) + r"$")
+
+
+@lru_cache(maxsize=None)
+def _batch_codes_for(year):
+    """
+    Get the codes of the YC batches of a year
+
+    W = Winter, S = Summer, plus F = Fall from 2024 and X = Spring from 2025.
+
+    Args:
+        year (int): Full year, e.g. 2024
+
+    Returns:
+        tuple: Batch codes, e.g. ("W24", "S24", "F24")
+    """
+    short_year = f"{year % 100:02d}"
+    codes = [f"W{short_year}", f"S{short_year}"]
+    if year >= 2024:
+        codes.append(f"F{short_year}")
+    if year >= 2025:
+        codes.append(f"X{short_year}")
+    return tuple(codes)
+
+
+@lru_cache(maxsize=None)
+def _chromedriver_path():
+    """
+    Resolve chromedriver once per process
+
+    CHROMEDRIVER_PATH points at an installed driver, skipping webdriver-manager
+    (and its version check) entirely. Otherwise the driver is downloaded if
+    needed.
+    """
+    return os.getenv("CHROMEDRIVER_PATH") or ChromeDriverManager().install()
+
+
+def _create_driver(headless=True):
+    """Start a Chrome browser configured for scraping"""
+    # Configure Chrome options
+    chrome_options = Options()
+    if headless:
+        chrome_options.add_argument("--headless")  # Run in headless mode
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--window-size=1920,1080")
+    # Only the text of the page is scraped, so return from get() once the DOM
+    # is ready and skip downloading images and fonts. Stylesheets still load,
+    # element text (and so the line layout locations are parsed from) depends
+    # on them.
+    chrome_options.page_load_strategy = "eager"
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_argument("--disable-features=Translate,MediaRouter")
+    chrome_options.add_experimental_option(
+        "prefs",
+        {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+        },
+    )
+    # Use a more human-like user agent
+    chrome_options.add_argument(
+        "--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36"
+    )
+
+    return webdriver.Chrome(
+        service=Service(_chromedriver_path()), options=chrome_options
+    )
+
+
+def _quit_driver(driver):
+    """Quit a browser, ignoring browsers that already died"""
+    try:
+        driver.quit()
+        logger.info("Closed Selenium browser")
+    except Exception:
+        pass
+
+
+class _DriverPool:
+    """
+    Warm Chrome browsers shared by all scrapers in the process
+
+    Starting Chrome takes seconds, so released browsers are reset and kept for
+    the next acquire() instead of being quit. At most `size` idle browsers are
+    kept per headless mode, extra ones are quit on release.
+    """
+
+    def __init__(self, size):
+        self._idle = {
+            True: queue.LifoQueue(maxsize=size),
+            False: queue.LifoQueue(maxsize=size),
+        }
+        atexit.register(self.close_all)
+
+    def acquire(self, headless=True):
+        """Get an idle browser that is still alive, or start a new one"""
+        idle = self._idle[bool(headless)]
+        while True:
+            try:
+                driver = idle.get_nowait()
+            except queue.Empty:
+                return _create_driver(headless)
+            try:
+                driver.current_url  # Raises if the browser has died
+                return driver
+            except Exception:
+                _quit_driver(driver)
+
+    def release(self, driver, headless=True):
+        """Reset a browser and keep it for reuse"""
+        try:
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+            self._idle[bool(headless)].put_nowait(driver)
+        except Exception:  # Dead browser, or enough idle ones already
+            _quit_driver(driver)
+
+    def close_all(self):
+        """Quit every idle browser"""
+        for idle in self._idle.values():
+            while True:
+                try:
+                    _quit_driver(idle.get_nowait())
+                except queue.Empty:
+                    break
+
+
+_driver_pool = _DriverPool(DRIVER_POOL_SIZE)
+
 
 class SeleniumYCScraper(BaseScraper):
     """Y Combinator startup data scraper using Selenium with dynamic location detection"""
 
+    # fetch_startups() saves each startup as it is processed
+    saves_startups = True
+
+    # Location data loaded from the database, shared by all scraper instances
+    # and keyed by the row count and last update of the startups table
+    _location_cache = {
+        "stamp": None,
+        "loaded_at": 0.0,
+        "known": set(),
+        "known_ascii": set(),
+        "prefixes": set(),
+        "prefix_trie": {},
+    }
+
     def __init__(self):
         super().__init__()
         self.source_name = "YC"
@@ -43,10 +490,18 @@ class SeleniumYCScraper(BaseScraper):
         self.stats = {"added": 0, "updated": 0, "unchanged": 0, "total": 0}
         self.current_run = None
 
+        # Results of validate_location(), _is_description_not_location() and
+        # clean_company_name()
+        self._validation_cache = LRUCache(LOCATION_MEMO_SIZE)
+        self._description_cache = LRUCache(LOCATION_MEMO_SIZE)
+        self._clean_name_cache = LRUCache(LOCATION_MEMO_SIZE)
+
         # Initialize with minimal fallback location data
         # These will be supplemented with database-driven data
-        self.common_location_prefixes = ["San", "New", "Los"]
+        self.common_location_prefixes = {"San", "New", "Los"}
+        self._prefix_trie = _build_trie(self.common_location_prefixes)
         self.known_locations = set()
+        self._known_locations_ascii = set()  # Known locations without accents
 
         # Initialize geographic indicators
         self._init_geographic_indicators()
@@ -54,38 +509,85 @@ class SeleniumYCScraper(BaseScraper):
         # Load known locations from the database
         self.refresh_location_data()
 
-    def refresh_location_data(self):
+    def refresh_location_data(self, force=False):
         """
         Load known locations from the database to improve location detection
         Should be called periodically to keep location data fresh
+
+        The distinct locations are only queried again when startups were added
+        or updated since the last load, or after LOCATION_CACHE_TTL seconds.
+
+        Args:
+            force (bool): Reload even if the cached data is still current
         """
         try:
-            # Query distinct locations from the database
-            locations = db.session.query(Startup.location).distinct().all()
+            cache = self._location_cache
+            stamp = tuple(
+                db.session.query(
+                    func.count(Startup.id), func.max(Startup.updated_at)
+                ).one()
+            )
+            if (
+                not force
+                and cache["stamp"] == stamp
+                and time.monotonic() - cache["loaded_at"] < LOCATION_CACHE_TTL
+            ):
+                if self.known_locations is not cache["known"]:
+                    self._validation_cache.clear()
+                    self._clean_name_cache.clear()
+                self.known_locations = cache["known"]
+                self._known_locations_ascii = cache["known_ascii"]
+                self.common_location_prefixes = cache["prefixes"]
+                self._prefix_trie = cache["prefix_trie"]
+                return
+
+            # Query distinct locations from the database, skipping empty and
+            # very short ones in SQL, and stream them in chunks instead of
+            # loading the whole result at once
+            locations = (
+                db.session.query(Startup.location)
+                .filter(func.length(Startup.location) > 2)
+                .distinct()
+                .yield_per(1000)
+            )
 
-            # Extract location strings from query results and filter out invalid ones
-            location_strings = []
-            for loc in locations:
-                if loc[0] and len(loc[0]) > 2:
-                    # Filter out descriptions that were mistakenly stored as locations
-                    if not self._is_description_not_location(loc[0]):
-                        location_strings.append(loc[0])
+            # Filter out descriptions that were mistakenly stored as locations
+            location_strings = [
+                location
+                for (location,) in locations
+                if not self._is_description_not_location(location)
+            ]
 
             # Store in a set for efficient lookups
             self.known_locations = set(location_strings)
-
-            # Extract common prefixes from locations for pattern matching
-            prefixes = set()
+            self._known_locations_ascii = {
+                strip_accents(location) for location in location_strings
+            }
+
+            # Extract common prefixes from locations for pattern matching, on
+            # top of the current ones so the essential fallbacks are kept. A
+            # new set, as the current one may be shared through the cache
+            prefixes = set(self.common_location_prefixes)
             for location in location_strings:
                 words = location.split()
                 if words and len(words[0]) >= 2:
                     prefixes.add(words[0])
-
-            # Update our common location prefixes with database-derived ones
-            # But keep the essential fallbacks
-            self.common_location_prefixes = list(
-                set(self.common_location_prefixes) | prefixes
-            )
+            self.common_location_prefixes = prefixes
+            self._prefix_trie = _build_trie(prefixes)
+
+            # Confidence scores and cleaned names depend on the known locations
+            self._validation_cache.clear()
+            self._clean_name_cache.clear()
+
+            # Replaced as a whole, the cached collections are only read
+            self.__class__._location_cache = {
+                "stamp": stamp,
+                "loaded_at": time.monotonic(),
+                "known": self.known_locations,
+                "known_ascii": self._known_locations_ascii,
+                "prefixes": self.common_location_prefixes,
+                "prefix_trie": self._prefix_trie,
+            }
 
             logger.info(
                 f"Refreshed location data: {len(self.known_locations)} locations, {len(self.common_location_prefixes)} prefixes"
@@ -406,7 +908,48 @@ class SeleniumYCScraper(BaseScraper):
             "Peninsula",
         }
 
+        # All substring indicators in one pattern, so a single scan of the text
+        # finds any of them
+        indicators = self.countries | self.major_cities | set(self.special_locations)
+        self._geo_indicator_re = re.compile(
+            "|".join(map(re.escape, sorted(indicators, key=len, reverse=True)))
+        )
+        self._location_ending_re = re.compile(
+            " (?:" + "|".join(map(re.escape, self.location_endings)) + r")\Z"
+        )
+
+        # Patterns of _verify_company_location_separation() per city, in the
+        # iteration order of the cities: a city glued to the end of a word
+        self._city_prefix_patterns = [
+            (re.compile(r"([A-Za-z]+)(" + re.escape(city) + r")"), city)
+            for city in self.major_cities
+            # Skip short city names to avoid false positives
+            if len(city) > 3
+        ]
+        # Cities by character, as is and ignoring case, to find the longest
+        # city at a position ("San Francisco" rather than "San")
+        self._city_trie = _build_trie(self.major_cities)
+        self._city_trie_folded = _build_trie(self.major_cities, fold=True)
+        # Any city, and any city ending a name, in one pattern each
+        cities = "|".join(map(re.escape, self.major_cities))
+        self._city_re = re.compile(cities)
+        self._city_end_re = re.compile(f"(?:{cities})$", re.IGNORECASE)
+        # Last letters of the cities, lowercased, to rule out names that end
+        # with none of them before running the pattern above
+        self._city_tail_len = min(map(len, self.major_cities))
+        self._city_tails = {
+            city[-self._city_tail_len :].lower() for city in self.major_cities
+        }
+
     def _is_description_not_location(self, text):
+        """Check if text is likely a description rather than a location (memoized)"""
+        result = self._description_cache.get(text)
+        if result is None:
+            result = self._looks_like_description(text)
+            self._description_cache.set(text, result)
+        return result
+
+    def _looks_like_description(self, text):
         """Check if text is likely a description rather than a location"""
         if not text:
             return True
@@ -419,81 +962,28 @@ class SeleniumYCScraper(BaseScraper):
         if "." in text and len(text.split(".")) > 1:
             return True
 
-        # Common department/business terms that are not locations
-        department_terms = [
-            "ENGINEERING",
-            "PRODUCT",
-            "DESIGN",
-            "MARKETING",
-            "SALES",
-            "CUSTOMER",
-            "SUPPORT",
-            "FINANCE",
-            "HR",
-            "OPERATIONS",
-            "TALENT",
-            "TECH",
-            "TEAM",
-            "DEPARTMENT",
-            "DIVISION",
-            "MANAGEMENT",
-            "STAFF",
-            "LEADERSHIP",
-            "CENTER",
-            "GROUP",
-            "DIRECTOR",
-            "HEAD",
-            "VP",
-            "CHIEF",
-            "EXECUTIVE",
-        ]
-
         # If text contains ALL CAPS words matching department terms, it's likely not a location
-        words = text.split()
-        uppercase_words = [w for w in words if w.isupper() and len(w) > 2]
-        if uppercase_words:
-            dept_matches = sum(1 for w in uppercase_words if w in department_terms)
-            if dept_matches > 0:
-                return True
+        uppercase_words = [w for w in text.split() if w.isupper() and len(w) > 2]
+        if not DEPARTMENT_TERMS.isdisjoint(uppercase_words):
+            return True
 
         # Check for common separator patterns in departments (X, Y AND Z)
         if " AND " in text.upper() or " & " in text:
             return True
 
-        # Check for description-like phrases
-        description_phrases = [
-            "platform",
-            "software",
-            "marketplace",
-            "solution",
-            "service",
-            "app",
-            "API",
-            "for",
-            "that",
-            "helps",
-            "enables",
-            "empowers",
-            "building",
-            "powered by",
-            "industry",
-            "businesses",
-            "product",
-            "technology",
-            "the",
-            "your",
-            "provides",
-            "offering",
-        ]
+        # Count description words/phrases in the text (substring matches), two
+        # are always enough to call it a description
+        lower_text = text.lower()
+        desc_count = 0
+        for phrase in DESCRIPTION_PHRASES:
+            if phrase in lower_text:
+                desc_count += 1
+                if desc_count >= 2:
+                    return True
 
-        # Count how many description words/phrases are in the text
+        # If more than 25% of words are description indicators
         word_count = len(text.split())
-        desc_count = sum(
-            1 for phrase in description_phrases if phrase.lower() in text.lower()
-        )
-
-        # If more than 25% of words are description indicators or contains multiple indicators
-        if desc_count >= 2 or (desc_count > 0 and desc_count / word_count > 0.25):
+        if desc_count > 0 and desc_count / word_count > 0.25:
             return True
 
         # Check for geographic indicators (if none present, might be a description)
@@ -508,15 +998,12 @@ class SeleniumYCScraper(BaseScraper):
         if not text:
             return False
 
-        text_parts = text.split(",")
-
-        # Look for common country names
-        for country in self.countries:
-            if country in text:
-                return True
+        # Look for country names, major cities and special location codes
+        if self._geo_indicator_re.search(text):
+            return True
 
         # Look for state/province codes after a comma (e.g., "City, CA")
-        for part in text_parts[1:]:  # Skip the first part (likely city name)
+        for part in text.split(",")[1:]:  # Skip the first part (likely city name)
             part = part.strip()
             if part in self.states_provinces:
                 return True
@@ -526,25 +1013,14 @@ class SeleniumYCScraper(BaseScraper):
                 if word in self.states_provinces and len(word) == 2:
                     return True
 
-        # Check for major cities
-        for city in self.major_cities:
-            if city in text:
-                return True
-
-        # Check for special location codes
-        for code in self.special_locations:
-            if code in text:
-                return True
-
         # Check for location endings
-        for ending in self.location_endings:
-            if text.endswith(" " + ending):
-                return True
+        if self._location_ending_re.search(text):
+            return True
 
         # Check for postal/zip code patterns
-        if re.search(r"\b\d{5}(?:-\d{4})?\b", text):  # US zip code
+        if US_ZIP_RE.search(text):  # US zip code
             return True
-        if re.search(r"\b[A-Z]\d[A-Z] \d[A-Z]\d\b", text):  # Canadian postal code
+        if CA_POSTAL_RE.search(text):  # Canadian postal code
             return True
 
         return False
@@ -553,7 +1029,17 @@ class SeleniumYCScraper(BaseScraper):
         """
         Validate potential location with multiple checks to ensure it's an actual geographic location
         Returns a confidence score (0-100) or 0 if definitely not a location
+
+        Scores are memoized until the known locations change.
         """
+        confidence = self._validation_cache.get(potential_location)
+        if confidence is None:
+            confidence = self._score_location(potential_location)
+            self._validation_cache.set(potential_location, confidence)
+        return confidence
+
+    def _score_location(self, potential_location):
+        """Compute the confidence score of validate_location()"""
         if not potential_location:
             return 0
 
@@ -573,54 +1059,26 @@ class SeleniumYCScraper(BaseScraper):
             # Text is likely a department or business unit, not a location
             return 0
 
+        # Direct match with known locations - highest confidence, checked
+        # before any of the text scans below
+        if potential_location in self.known_locations:
+            return 100
+
         # First check if it's likely a description rather than a location
         if self._is_description_not_location(potential_location):
             return 0
 
-        # Direct match with known locations - highest confidence
-        if potential_location in self.known_locations:
-            confidence += 80
-
         # Contains geographic indicators - strong signal
         if self._contains_geographic_indicator(potential_location):
             confidence += 50
 
         # Contains common location words
-        location_words = [
-            "city",
-            "san",
-            "new",
-            "los",
-            "bay",
-            "north",
-            "south",
-            "east",
-            "west",
-        ]
-        contains_location_word = any(
-            word.lower() in potential_location.lower() for word in location_words
-        )
-        if contains_location_word:
+        lowered = potential_location.lower()
+        if any(word in lowered for word in LOCATION_WORDS):
             confidence += 20
 
         # Check for disqualifiers that indicate descriptions, not locations
-        description_phrases = [
-            "platform for",
-            "software for",
-            "marketplace for",
-            "solution for",
-            "the future of",
-            "service for",
-            "helps",
-            "enables",
-            "building",
-            "powered by",
-            "industry",
-            "for businesses",
-            "for enterprises",
-        ]
-
-        if any(phrase in potential_location.lower() for phrase in description_phrases):
+        if any(phrase in lowered for phrase in DISQUALIFYING_PHRASES):
             return 0
 
         # Check if contains punctuation common in descriptions
@@ -636,7 +1094,7 @@ class SeleniumYCScraper(BaseScraper):
             confidence += 30
 
         # Check for postal/zip code pattern (numbers followed by city)
-        if re.search(r"\d{4,6}\s+[A-Z][a-z]+", potential_location):
+        if POSTAL_CITY_RE.search(potential_location):
             confidence += 40
 
         # Special handling for international locations
@@ -647,118 +1105,98 @@ class SeleniumYCScraper(BaseScraper):
                 break
 
         # Check for South American locations with accented characters
-        if re.search(r"[àáâãäåçèéêëìíîïñòóôõöùúûüýÿ]", potential_location):
+        # (ASCII text, the common case, has none)
+        if not potential_location.isascii() and not ACCENT_CHARS.isdisjoint(
+            potential_location
+        ):
             # If text has accented chars and looks like a location pattern
-            if re.search(
-                r"[A-Z][a-zàáâãäåçèéêëìíîïñòóôõöùúûüýÿ]+,?\s", potential_location
-            ):
+            if ACCENT_LOC_RE.search(potential_location):
                 confidence += 30
 
-        # Normalize for international characters and check known locations again
-        normalized = unicodedata.normalize("NFD", potential_location)
-        normalized = "".join([c for c in normalized if not unicodedata.combining(c)])
-
-        if normalized in self.known_locations:
+        # Compare without accents, so "Bogota" matches a known "Bogotá"
+        if strip_accents(potential_location) in self._known_locations_ascii:
             confidence += 50
 
         # Cap confidence at 100
         return min(confidence, 100)
 
-    def _extract_location(self, driver, text_content):
+    def _extract_location(self, page_locations, text_content):
         """
         Extract location information using multiple strategies
         Returns the most likely location string or empty string if none found
+
+        Args:
+            page_locations (list): Texts of the page's location elements
+            text_content (str): Text of the company link
         """
         location = ""
-        potential_locations = []
+        # Best confidence seen per candidate, so a location found repeatedly
+        # is only scored and compared once
+        potential_locations = {}
 
         # First try element-based location detection (most reliable)
-        location_patterns = [
-            '//div[contains(@class, "location")]',
-            '//span[contains(@class, "location")]',
-            '//div[contains(text(), "Location:")]/following-sibling::div',
-            '//span[contains(text(), "location:")]/following-sibling::span',
-        ]
-
-        for pattern in location_patterns:
-            try:
-                loc_elem = driver.find_element(By.XPATH, pattern)
-                if loc_elem:
-                    location = loc_elem.text.strip()
-                    if location and self.validate_location(location) > 50:
-                        logger.info(f"Found location from element: '{location}'")
-                        return location
-                    potential_locations.append(
-                        (location, 50)
-                    )  # Medium confidence for element-based
-            except:
-                pass
-
-        # Next try text-based pattern matching
-        lines = text_content.split("\n")
+        for location in page_locations:
+            if location and self.validate_location(location) > 50:
+                logger.info(f"Found location from element: '{location}'")
+                return location
+            # Medium confidence for element-based
+            potential_locations[location] = 50
 
-        # Pattern-based location detection with international format support
-        location_patterns = [
-            # City, State, Country (US format)
-            r"([A-Z][a-zÀ-ÿ]+(?:[\s-][A-Z][a-zÀ-ÿ]+)*),\s*([A-Z]{2}|[A-Za-zÀ-ÿ ]+),\s*([A-Za-zÀ-ÿ ]+)",
-            # City, State/Country
-            r"([A-Z][a-zÀ-ÿ]+(?:[\s-][A-Z][a-zÀ-ÿ]+)*),\s*([A-Z]{2}|[A-Za-zÀ-ÿ ]+)",
-            # City, Country
-            r"([A-Z][a-zÀ-ÿ]+(?:[\s-][A-Z][a-zÀ-ÿ]+)*),\s*([A-Za-zÀ-ÿ ]+)",
-            # Country (Region) format - common in Asia
-            r"([A-Za-zÀ-ÿ ]+)\s*\(([A-Za-zÀ-ÿ ]+)\)",
-            # Postal code city format (Europe)
-            r"(\d{4,6})\s+([A-Z][a-zÀ-ÿ]+(?:[\s-][A-Z][a-zÀ-ÿ]+)*)",
-        ]
+        # Next try text-based pattern matching. Lines are stripped once and
+        # blank ones dropped, and as pages repeat lines (e.g. tags) every
+        # distinct line after the first is only checked once
+        lines = [line for line in map(str.strip, text_content.split("\n")) if line]
+        company_line = lines[0] if lines else ""
+        other_lines = list(dict.fromkeys(lines[1:]))
 
-        for line in lines:
+        for line in other_lines:
             # Skip very short lines or lines likely to be the company name (first line)
-            if len(line) < 5 or line == lines[0]:
+            if len(line) < 5 or line == company_line:
                 continue
 
-            # Try each location pattern
-            for pattern in location_patterns:
-                match = re.search(pattern, line)
+            # Every pattern needs a comma, a parenthesis or a digit, which
+            # rules out most prose lines without running them
+            if not LOCATION_HINT_RE.search(line):
+                continue
+
+            # Try each location pattern (international formats included)
+            for pattern in LOCATION_PATTERNS:
+                match = pattern.search(line)
                 if match:
                     location = match.group(0)
+                    # Already scored, e.g. matched by a broader pattern too
+                    if location in potential_locations:
+                        continue
                     confidence = self.validate_location(location)
                     if confidence > 70:  # Higher threshold for pattern matches
                         logger.info(
                             f"Found location from pattern: '{location}' with confidence {confidence}"
                         )
                         return location
-                    potential_locations.append((location, confidence))
+                    potential_locations[location] = confidence
 
         # Check against database of known locations
-        for line in lines[1:]:  # Skip first line (likely company name)
+        for line in other_lines:  # Skip first line (likely company name)
             confidence = self.validate_location(line)
             if confidence > 60:  # Good confidence level
-                location = line.strip()
+                location = line
                 logger.info(
                     f"Found location from database match: '{location}' with confidence {confidence}"
                 )
                 return location
             elif confidence > 30:  # Possible match
-                potential_locations.append((line.strip(), confidence))
-
-        # If we have potential locations, pick the one with highest confidence
-        if potential_locations:
-            potential_locations.sort(key=lambda x: x[1], reverse=True)
-            if potential_locations[0][1] > 30:  # Minimum threshold
-                return potential_locations[0][0]
-
-        # Fallback: Look for lines that might be just a location
-        for line in lines[1:]:  # Skip first line (likely company name)
-            # Check if this looks like a standalone location
-            # Typically these have commas and aren't very long
-            if "," in line and 5 < len(line) < 50:
-                confidence = self.validate_location(line)
-                if confidence > 30:
-                    location = line.strip()
-                    logger.info(
-                        f"Found potential location: '{location}' with confidence {confidence}"
-                    )
-                    return location
+                potential_locations[line] = max(
+                    potential_locations.get(line, 0), confidence
+                )
+
+        # Pick the potential location with highest confidence. Every line
+        # scoring above 30 is among them, so when none qualifies there is no
+        # standalone location line left to fall back on
+        best_location, best_confidence = max(
+            potential_locations.items(), key=lambda x: x[1], default=("", 0)
+        )
+        if best_confidence > 30:  # Minimum threshold
+            return best_location
 
         # No location found
         return ""
@@ -777,19 +1215,22 @@ class SeleniumYCScraper(BaseScraper):
             limit (int, optional): Maximum number of startups to process
 
         Returns:
-            list: List of startup dictionaries
+            list: List of processed startup dictionaries that were saved
         """
         logger.info(
             f"Starting to scrape YC startups with Selenium for year: {year or 'all'}, limit: {limit or 'none'}"
         )
 
-        # Refresh location data before starting scraping
+        # Refresh location data before starting scraping (a cheap check when
+        # nothing changed since __init__ loaded it)
         self.refresh_location_data()
 
         # Create scraper run record if tracking enabled
         if track_run:
             try:
-                self.current_run = create_scraper_run(self.source_name, db)
+                self.current_run = create_scraper_run(
+                    self.source_name, db, task_id=self.task_id
+                )
                 logger.info(f"Created scraper run #{self.current_run.id}")
             except Exception as e:
                 logger.error(f"Failed to create scraper run record: {e}")
@@ -801,25 +1242,58 @@ class SeleniumYCScraper(BaseScraper):
                 year, headless=headless, wait_time=wait_time, limit=limit
             )
 
-            # Save each startup to the database
+            # Stage the startups in chunks of PERSIST_CHUNK_SIZE, loading the
+            # saved ones of a chunk in one query and committing once per chunk.
+            # The next chunk is processed on a worker thread meanwhile, so its
+            # parsing overlaps the database round trips of this one. Only one
+            # chunk is processed ahead, holding at most two in memory.
             saved_startups = []
-            for raw_startup_data in startups:
-                try:
-                    # Process the raw data into a standardized format
-                    processed_data = self.process_startup_data(raw_startup_data)
+            remaining = iter(startups)
+            chunks = iter(lambda: list(islice(remaining, PERSIST_CHUNK_SIZE)), [])
+            app = current_app._get_current_object()
+
+            def process(chunk):
+                # The worker needs its own app context (and database session)
+                with app.app_context():
+                    return self._process_chunk(chunk)
+
+            with self._db_writes, ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="yc-process"
+            ) as pool:
+                chunk = next(chunks, None)
+                pending = pool.submit(process, chunk) if chunk else None
+                while pending is not None:
+                    processed_chunk = pending.result()
+                    chunk = next(chunks, None)
+                    pending = pool.submit(process, chunk) if chunk else None
+
+                    existing_startups = self._load_existing_startups(processed_chunk)
+                    for processed_data in processed_chunk:
+                        try:
+                            key = (processed_data["name"], processed_data.get("batch"))
+
+                            # A savepoint per startup so a bad record only drops itself
+                            with db.session.begin_nested():
+                                startup, is_created = self._prepare_startup(
+                                    dict(processed_data), existing_startups.get(key)
+                                )
+                            # A later record of the same startup updates this one
+                            existing_startups[key] = startup
+                            saved_startups.append(processed_data)
 
-                    # Save the processed data to the database
-                    startup, is_created = self._save_startup_to_db(processed_data)
-                    saved_startups.append(startup)
+                            status = "Created" if is_created else "Updated"
+                            logger.info(
+                                f"{status} startup in database: {processed_data['name']}"
+                            )
+                        except Exception as e:
+                            logger.error(
+                                f"Failed to save startup {processed_data.get('name', 'Unknown')}: {e}"
+                            )
 
-                    status = "Created" if is_created else "Updated"
-                    logger.info(
-                        f"{status} startup in database: {processed_data['name']}"
-                    )
-                except Exception as e:
-                    logger.error(
-                        f"Failed to save startup {raw_startup_data.get('name', 'Unknown')}: {e}"
-                    )
+                    db.session.commit()
+
+            # Drop cached API responses that may now be stale
+            invalidate_startup_cache()
 
             # Update stats with total count
             self.stats["total"] = len(startups)
@@ -856,41 +1330,11 @@ class SeleniumYCScraper(BaseScraper):
         all_startups = []
         failed_extractions = []
 
-        # Configure Chrome options
-        chrome_options = Options()
-        if headless:
-            chrome_options.add_argument("--headless")  # Run in headless mode
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--window-size=1920,1080")
-        # Use a more human-like user agent
-        chrome_options.add_argument(
-            "--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36"
-        )
-
-        # Set up the driver
         try:
-            driver = webdriver.Chrome(
-                service=Service(ChromeDriverManager().install()), options=chrome_options
-            )
-
-            batches = []
             if year:
-                # Use the batch parameter to filter by year
-                # YC uses batches like W22, S22 for 2022
-                short_year = str(year)[-2:]
-                # Create separate batches for different sessions
-                # W = Winter, S = Spring, F = Fall (2024+), X = Summer (2025+)
-                batches = [f"W{short_year}", f"S{short_year}"]
-
-                # Add Fall batch for 2024 and later
-                if year >= 2024:
-                    batches.append(f"F{short_year}")
-
-                # Add Summer batch for 2025 and later
-                if year >= 2025:
-                    batches.append(f"X{short_year}")
-
+                # Use the batch parameter to filter by year, scraping each
+                # batch of the year individually
+                batches = list(_batch_codes_for(year))
                 logger.info(
                     f"Will scrape each batch individually: {', '.join(batches)}"
                 )
@@ -903,129 +1347,51 @@ class SeleniumYCScraper(BaseScraper):
                 logger.info(
                     f"No year specified, scraping last 5 years: {years_to_scrape}"
                 )
-
-                for year_to_scrape in years_to_scrape:
-                    short_year = str(year_to_scrape)[-2:]
-                    year_batches = [f"W{short_year}", f"S{short_year}"]
-
-                    # Add Fall batch for 2024 and later
-                    if year_to_scrape >= 2024:
-                        year_batches.append(f"F{short_year}")
-
-                    # Add Summer batch for 2025 and later
-                    if year_to_scrape >= 2025:
-                        year_batches.append(f"X{short_year}")
-
-                    batches.extend(year_batches)
-
-                logger.info(f"Will scrape these batches: {', '.join(batches)}")
-
-            # Process each batch separately
-            for batch in batches:
-                # Navigate directly with filter URL parameters
-                url = self.base_url
-                if batch:
-                    url = f"{url}?batch={batch}"
-                    logger.info(f"Scraping batch: {batch} at URL: {url}")
-                else:
-                    logger.info(f"Scraping all batches at URL: {url}")
-
-                # Retry mechanism for page load
-                max_retries = 3
-                retry_count = 0
-                while retry_count < max_retries:
-                    try:
-                        logger.info(f"Navigating to {url} (attempt {retry_count + 1})")
-                        driver.get(url)
-
-                        # Wait for the page to load with multiple conditions
-                        wait = WebDriverWait(driver, wait_time + 5)
-                        wait.until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, "body"))
-                        )
-                        wait.until(
-                            EC.presence_of_element_located(
-                                (
-                                    By.CSS_SELECTOR,
-                                    'a[class*="_company_"], a[href^="/companies/"]',
-                                )
-                            )
-                        )
-
-                        # Allow time for JavaScript to render content
-                        time.sleep(wait_time)
-                        break
-                    except Exception as e:
-                        retry_count += 1
-                        logger.warning(
-                            f"Failed to load page (attempt {retry_count}): {e}"
-                        )
-                        if retry_count == max_retries:
-                            logger.error(
-                                f"Failed to load page after {max_retries} attempts"
-                            )
-                            continue
-
-                # Multiple selectors for company links
-                selectors = [
-                    'a[class*="_company_"]',
-                    'a[href^="/companies/"]',
-                    'div[class*="rightCol"] a',
-                    'div[class*="company-card"] a',
-                    'div[class*="CompanyCard"] a',
+                batches = [
+                    batch
+                    for year_to_scrape in years_to_scrape
+                    for batch in _batch_codes_for(year_to_scrape)
                 ]
+                logger.info(f"Will scrape these batches: {', '.join(batches)}")
 
-                company_links = []
-                for selector in selectors:
-                    try:
-                        links = driver.find_elements(By.CSS_SELECTOR, selector)
-                        if links:
-                            company_links.extend(links)
-                            logger.info(
-                                f"Found {len(links)} companies with selector: {selector}"
-                            )
-                            break
-                    except Exception as e:
-                        logger.warning(f"Failed with selector {selector}: {e}")
-
-                if not company_links:
-                    logger.error("No company links found with any selector")
-                    continue
+            # Batches are independent page loads, so several are scraped at
+            # once, each in its own browser from the driver pool (which keeps
+            # them warm between fetches)
+            workers = min(len(batches), BATCH_WORKERS)
+            if workers > 1:
+                app = current_app._get_current_object()
+
+                def scrape(batch):
+                    # The worker needs its own app context (and database session)
+                    # for the location refresh that name cleaning may trigger
+                    with app.app_context():
+                        return self._scrape_batch(batch, headless, wait_time, limit)
+
+                executor = ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="yc-batch"
+                )
+                results = executor.map(scrape, batches)
+            else:
+                executor = None
+                results = (
+                    self._scrape_batch(batch, headless, wait_time, limit)
+                    for batch in batches
+                )
 
-                # Process each company
-                processed_count = 0
-                for i, link in enumerate(company_links):
-                    try:
-                        # Check if we've reached the limit
-                        if limit and processed_count >= limit:
-                            logger.info(
-                                f"Reached limit of {limit} companies, stopping scraping"
-                            )
-                            break
+            try:
+                for batch_startups, batch_failures in results:
+                    all_startups.extend(batch_startups)
+                    failed_extractions.extend(batch_failures)
 
-                        # Extract company data with retry mechanism
-                        company_data = self._extract_company_data_with_retry(
-                            driver, link, i, len(company_links)
-                        )
-                        if company_data:
-                            all_startups.append(company_data)
-                            processed_count += 1
-                    except Exception as e:
-                        logger.error(f"Failed to process company {i+1}: {e}")
-                        failed_extractions.append(
-                            {
-                                "index": i,
-                                "error": str(e),
-                                "link": link.get_attribute("href"),
-                            }
+                    # Check if we've reached the limit after processing this batch
+                    if limit and len(all_startups) >= limit:
+                        logger.info(
+                            f"Reached limit of {limit} companies, skipping remaining batches"
                         )
-
-                # Check if we've reached the limit after processing this batch
-                if limit and len(all_startups) >= limit:
-                    logger.info(
-                        f"Reached limit of {limit} companies, skipping remaining batches"
-                    )
-                    break
+                        break
+            finally:
+                if executor is not None:
+                    executor.shutdown(cancel_futures=True)
 
             # Log failed extractions
             if failed_extractions:
@@ -1042,172 +1408,400 @@ class SeleniumYCScraper(BaseScraper):
             logger.error(traceback.format_exc())
             return []
 
+    def _fetch_batch_algolia(self, batch, limit=None):
+        """
+        Fetch the companies of one YC batch from the directory's search index
+
+        The directory page loads its companies from Algolia, so asking the
+        index directly gets the same data as JSON without a browser. Location
+        and description come as separate fields, no text parsing needed.
+
+        Args:
+            batch (str): Batch code like "W22"
+            limit (int, optional): Maximum number of companies to return
+
+        Returns:
+            list: Company dictionaries, empty when the index is not configured
+                or the request fails, so the caller can fall back to Selenium
+        """
+        if not YC_ALGOLIA_API_KEY or not batch:
+            return []
+
+        url = f"https://{YC_ALGOLIA_APP_ID.lower()}-dsn.algolia.net/1/indexes/{YC_ALGOLIA_INDEX}"
+        headers = {
+            "X-Algolia-Application-Id": YC_ALGOLIA_APP_ID,
+            "X-Algolia-API-Key": YC_ALGOLIA_API_KEY,
+        }
+        season = BATCH_SEASONS.get(batch[0])
+        batch_name = f"{season} 20{batch[1:]}" if season else batch
+
+        hits = []
+        page = 0
+        try:
+            while True:
+                data = self.http_get(
+                    url,
+                    headers=headers,
+                    params={
+                        "query": "",
+                        "facetFilters": f'["batch:{batch_name}"]',
+                        "hitsPerPage": ALGOLIA_HITS_PER_PAGE,
+                        "page": page,
+                    },
+                ).json()
+                hits.extend(data.get("hits", []))
+                page += 1
+                if page >= data.get("nbPages", 0) or (limit and len(hits) >= limit):
+                    break
+        except Exception as e:
+            logger.warning(f"Algolia fetch failed for batch {batch}: {e}")
+            return []
+
+        logger.info(f"Fetched {len(hits)} companies of batch {batch} from Algolia")
+
+        startups = []
+        for hit in hits[:limit] if limit else hits:
+            # Companies with several offices list them separated by semicolons
+            location = (hit.get("all_locations") or "").split(";")[0].strip()
+            slug = hit.get("slug")
+            startups.append(
+                {
+                    "name": (hit.get("name") or "").strip(),
+                    "description": (hit.get("one_liner") or "").strip(),
+                    "batch": self._batch_code(hit.get("batch")) or batch,
+                    "url": f"{self.base_url}/{slug}" if slug else "",
+                    "logo_url": hit.get("small_logo_thumb_url") or "",
+                    "tags": hit.get("tags") or [],
+                    "status": (hit.get("status") or "ACTIVE").upper(),
+                    "team_size": hit.get("team_size") or "",
+                    "location": location,
+                    "founders": [],
+                }
+            )
+        return startups
+
+    def _batch_code(self, batch):
+        """
+        Convert a batch name like "Winter 2022" to its code, "W22"
+
+        Args:
+            batch (str): Batch name or code
+
+        Returns:
+            str: Batch code, or None when the batch is neither a name nor a code
+                (the batch column only fits codes)
+        """
+        if not batch:
+            return None
+        if BATCH_CODE_RE.fullmatch(batch):
+            return batch
+        season, _, year = batch.partition(" ")
+        if season in BATCH_PREFIXES and len(year) == 4 and year.isdigit():
+            return f"{BATCH_PREFIXES[season]}{year[2:]}"
+        return None
+
+    def _scrape_batch(self, batch, headless=True, wait_time=10, limit=None):
+        """
+        Scrape the companies of one YC batch
+
+        Args:
+            batch (str): Batch code like "W22"
+            headless (bool): Whether to run the browser in headless mode
+            wait_time (int): How many seconds to wait for content to load
+            limit (int, optional): Maximum number of companies to process
+
+        Returns:
+            tuple: Company dictionaries and failed extractions of the batch
+        """
+        # Skip the browser entirely when the search index has the batch
+        startups = self._fetch_batch_algolia(batch, limit)
+        if startups:
+            return startups, []
+        failed_extractions = []
+
+        # Read everything needed from the page first, so the browser goes back
+        # to the pool before the companies are parsed
+        driver = _driver_pool.acquire(headless)
+        try:
+            company_links, page_locations = self._read_batch_page(
+                driver, batch, wait_time
+            )
         finally:
+            _driver_pool.release(driver, headless)
+
+        if not company_links:
+            logger.error("No company links found with any selector")
+            return startups, failed_extractions
+
+        # Process each company
+        processed_count = 0
+        for i, link in enumerate(company_links):
             try:
-                driver.quit()
-                logger.info("Closed Selenium browser")
-            except Exception:
-                pass
+                # Check if we've reached the limit
+                if limit and processed_count >= limit:
+                    logger.info(
+                        f"Reached limit of {limit} companies, stopping scraping"
+                    )
+                    break
+
+                # Extract company data from what was read off the page
+                company_data = self._extract_company_data(
+                    link, page_locations, i, len(company_links)
+                )
+                if company_data:
+                    startups.append(company_data)
+                    processed_count += 1
+            except Exception as e:
+                logger.error(f"Failed to process company {i+1}: {e}")
+                failed_extractions.append(
+                    {"index": i, "error": str(e), "link": link["href"]}
+                )
+
+        return startups, failed_extractions
+
+    def _read_batch_page(self, driver, batch, wait_time=10):
+        """
+        Load the companies page of a batch and read the company links off it
 
-    def _extract_company_data_with_retry(self, driver, link, index, total):
-        """Enhanced method to extract company data with dynamic location detection"""
+        Args:
+            driver (WebDriver): Browser to load the page in
+            batch (str): Batch code like "W22"
+            wait_time (int): How many seconds to wait for content to load
+
+        Returns:
+            tuple: Company links as dicts with their text, href and logo, and
+                the texts of the page's location elements
+        """
+        # Navigate directly with filter URL parameters
+        url = self.base_url
+        if batch:
+            url = f"{url}?batch={batch}"
+            logger.info(f"Scraping batch: {batch} at URL: {url}")
+        else:
+            logger.info(f"Scraping all batches at URL: {url}")
+
+        # Retry mechanism for page load
         max_retries = 3
         retry_count = 0
-
         while retry_count < max_retries:
             try:
-                # Extract text content
-                text_content = link.text.strip()
-                if not text_content:
-                    raise ValueError("Empty text content")
-
-                logger.info(f"\n=== Processing Company {index + 1}/{total} ===")
-                logger.info(f"Raw text content: '{text_content}'")
-
-                # First identify location - using both element-based and pattern-based approaches
-                location = self._extract_location(driver, text_content)
-
-                # Now extract company name
-                lines = text_content.split("\n")
-                raw_company_name = lines[0] if lines else ""
-
-                # If we found a location, try to extract company name
-                if location:
-                    # Verify location is valid with high confidence before using it
-                    location_confidence = self.validate_location(location)
-                    if location_confidence < 60:  # Higher threshold for acceptance
-                        logger.warning(
-                            f"Rejecting low-confidence location: '{location}' (score: {location_confidence})"
-                        )
-                        location = ""  # Reset location if confidence is too low
-                    else:
-                        # Clean the company name using our dynamic method
-                        clean_name = self.clean_company_name(raw_company_name, location)
+                logger.info(f"Navigating to {url} (attempt {retry_count + 1})")
+                driver.get(url)
+
+                # Wait for the page to load with multiple conditions
+                wait = WebDriverWait(driver, wait_time + 5)
+                wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "body")))
+                wait.until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, COMPANY_LINK_CSS))
+                )
+                break
+            except Exception as e:
+                retry_count += 1
+                logger.warning(f"Failed to load page (attempt {retry_count}): {e}")
+                if retry_count == max_retries:
+                    logger.error(f"Failed to load page after {max_retries} attempts")
+                    continue
 
-                        # Verify the cleaning actually did something
-                        if clean_name != raw_company_name:
-                            logger.info(
-                                f"Cleaned company name: '{raw_company_name}' -> '{clean_name}'"
-                            )
-                            raw_company_name = clean_name
-                        else:
-                            logger.info(
-                                f"No name cleaning needed for: '{raw_company_name}'"
-                            )
+        # Wait for JavaScript to finish rendering the companies, for at most
+        # wait_time seconds, instead of always sleeping the full time
+        if retry_count < max_retries:
+            self._wait_for_links_to_settle(driver, wait_time)
 
-                # If no location found or low confidence, try again with parsing
-                if not location:
-                    # If no location found, try to parse company name and location from raw text
-                    company, loc = self._try_parse_company_and_location(
-                        raw_company_name
-                    )
-                    if loc and self.validate_location(loc) >= 60:
-                        raw_company_name = company
-                        location = loc
-                        logger.info(
-                            f"Parsed company '{company}' and location '{loc}' from raw text"
-                        )
+        # Read the company links and the location elements in one script, a
+        # single browser round trip instead of several per link
+        try:
+            page = driver.execute_script(
+                READ_COMPANIES_JS, COMPANY_LINK_SELECTORS, LOCATION_ELEMENT_XPATHS
+            )
+        except Exception as e:
+            logger.error(f"Failed to read company links: {e}")
+            return [], []
+        if not page["links"]:
+            return [], []
+
+        # A company can be linked more than once (e.g. from its logo and its
+        # name), only its first link is extracted
+        seen = set()
+        links = []
+        for link in page["links"]:
+            if link["href"]:
+                if link["href"] in seen:
+                    continue
+                seen.add(link["href"])
+            links.append(link)
 
-                # Log final results after all parsing and cleaning
-                logger.info(f"Final company name: '{raw_company_name}'")
-                logger.info(f"Final location: '{location}'")
+        logger.info(f"Found {len(links)} companies with selector: {page['selector']}")
+        return links, page["locations"]
 
-                # Get description (first line that's not the company name or location)
-                description = ""
-                for line in lines[1:]:
-                    # Skip if the line matches the company name or location
-                    if (
-                        line.strip() == location.strip()
-                        or line.strip() == raw_company_name.strip()
-                    ):
-                        continue
-                    if line.strip():
-                        description = line.strip()
-                        break
+    def _wait_for_links_to_settle(self, driver, timeout):
+        """
+        Wait until the number of company links on the page stops growing
 
-                # Extract batch and tags
-                batch = ""
-                tags = []
-                batch_match = re.search(r"([WSFX]\d{2})", text_content)
-                if batch_match:
-                    batch = batch_match.group(0)
+        Args:
+            driver (WebDriver): Browser showing a companies page
+            timeout (int): Most seconds to wait, the page is read as it is
+                afterwards
+        """
+        counts = {"last": -1, "stable": 0}
 
-                # Try to extract logo URL
-                logo_url = ""
-                try:
-                    logo_elem = link.find_element(
-                        By.CSS_SELECTOR,
-                        'img[src*="bookface-images.s3"], img[src*="logo"], img[src*="Logo"]',
-                    )
-                    if logo_elem:
-                        logo_url = logo_elem.get_attribute("src")
-                except:
-                    pass
-
-                # Create company data structure
-                company_data = {
-                    "name": raw_company_name.strip(),
-                    "description": description.strip(),
-                    "batch": batch,
-                    "url": link.get_attribute("href") or "",
-                    "logo_url": logo_url,
-                    "tags": "",
-                    "status": "ACTIVE",
-                    "team_size": "",
-                    "location": location.strip(),
-                    "founders": [],
-                }
+        def settled(driver):
+            count = len(driver.find_elements(By.CSS_SELECTOR, COMPANY_LINK_CSS))
+            if count and count == counts["last"]:
+                counts["stable"] += 1
+            else:
+                counts["stable"] = 0
+            counts["last"] = count
+            return counts["stable"] >= LINK_COUNT_STABLE_POLLS
 
-                # Post-processing validation to catch and correct obvious errors
-                company_data = self._validate_and_correct_company_data(
-                    company_data, text_content
-                )
+        try:
+            WebDriverWait(
+                driver, timeout, poll_frequency=LINK_COUNT_POLL_INTERVAL
+            ).until(settled)
+        except Exception as e:
+            logger.warning(
+                f"Company links still changing after {timeout}s, reading page: {e}"
+            )
 
-                # Final verification for specific pattern issues
-                company_data = self._verify_company_location_separation(company_data)
+    def _extract_company_data(self, link, page_locations, index, total):
+        """
+        Extract company data with dynamic location detection
 
-                # Compare before and after post-processing
-                if company_data["name"] != raw_company_name:
-                    logger.info(
-                        f"Post-processing modified name: '{raw_company_name}' -> '{company_data['name']}'"
-                    )
+        Args:
+            link (dict): Text, href and logo read off the company link
+            page_locations (list): Texts of the page's location elements
+            index (int): Position of the company on the page
+            total (int): Number of companies on the page
 
-                if company_data["location"] != location:
-                    logger.info(
-                        f"Post-processing modified location: '{location}' -> '{company_data['location']}'"
-                    )
+        Returns:
+            dict: Company data
 
-                # Final validation check - name shouldn't be very short or contain location
-                if len(company_data["name"]) < 2:
-                    logger.warning(
-                        f"Final company name is suspiciously short: '{company_data['name']}'"
-                    )
+        Raises:
+            ValueError: If the link has no text, name or URL
+        """
+        # Extract text content
+        text_content = link["text"]
+        if not text_content:
+            raise ValueError("Empty text content")
 
-                if (
-                    company_data["location"]
-                    and company_data["location"] in company_data["name"]
-                ):
-                    logger.warning(
-                        f"Final company name still contains location: '{company_data['name']}' contains '{company_data['location']}'"
-                    )
+        # Per-company trace, only formatted when debug logging is on. Changes
+        # made to the name or location are still logged at info level.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"\n=== Processing Company {index + 1}/{total} ===")
+            logger.debug(f"Raw text content: '{text_content}'")
 
-                # Verify data completeness
-                if not company_data["name"] or not company_data["url"]:
-                    raise ValueError("Missing required company data")
+        # First identify location - using both element-based and pattern-based approaches
+        location = self._extract_location(page_locations, text_content)
 
-                logger.info(f"Final company data: {company_data}")
-                return company_data
+        # Now extract company name
+        lines = text_content.split("\n")
+        raw_company_name = lines[0] if lines else ""
 
-            except Exception as e:
-                retry_count += 1
+        # If we found a location, try to extract company name
+        if location:
+            # Verify location is valid with high confidence before using it
+            location_confidence = self.validate_location(location)
+            if location_confidence < 60:  # Higher threshold for acceptance
                 logger.warning(
-                    f"Failed to extract company data (attempt {retry_count}): {e}"
+                    f"Rejecting low-confidence location: '{location}' (score: {location_confidence})"
                 )
-                if retry_count == max_retries:
-                    raise
-                time.sleep(2)  # Wait before retry
+                location = ""  # Reset location if confidence is too low
+            else:
+                # Clean the company name using our dynamic method
+                clean_name = self.clean_company_name(raw_company_name, location)
 
-        return None
+                # Verify the cleaning actually did something
+                if clean_name != raw_company_name:
+                    logger.info(
+                        f"Cleaned company name: '{raw_company_name}' -> '{clean_name}'"
+                    )
+                    raw_company_name = clean_name
+                else:
+                    logger.debug(f"No name cleaning needed for: '{raw_company_name}'")
+
+        # If no location found or low confidence, try again with parsing
+        if not location:
+            # If no location found, try to parse company name and location from raw text
+            company, loc = self._try_parse_company_and_location(raw_company_name)
+            if loc and self.validate_location(loc) >= 60:
+                raw_company_name = company
+                location = loc
+                logger.info(
+                    f"Parsed company '{company}' and location '{loc}' from raw text"
+                )
+
+        # Log final results after all parsing and cleaning
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Final company name: '{raw_company_name}'")
+            logger.debug(f"Final location: '{location}'")
+
+        # Get description (first line that's not the company name or location)
+        skip = {location.strip(), raw_company_name.strip()}
+        description = next(
+            (line for line in map(str.strip, lines[1:]) if line and line not in skip),
+            "",
+        )
+
+        # Extract batch and tags
+        batch = ""
+        tags = []
+        batch_match = BATCH_CODE_RE.search(text_content)
+        if batch_match:
+            batch = batch_match.group(0)
+
+        # Create company data structure
+        company_data = {
+            "name": raw_company_name.strip(),
+            "description": description.strip(),
+            "batch": batch,
+            "url": link["href"],
+            "logo_url": link["logo"],
+            "tags": "",
+            "status": "ACTIVE",
+            "team_size": "",
+            "location": location.strip(),
+            "founders": [],
+        }
+
+        # Post-processing validation to catch and correct obvious errors
+        company_data = self._validate_and_correct_company_data(
+            company_data, text_content
+        )
+
+        # Final verification for specific pattern issues
+        company_data = self._verify_company_location_separation(company_data)
+
+        # Compare before and after post-processing
+        if company_data["name"] != raw_company_name:
+            logger.info(
+                f"Post-processing modified name: '{raw_company_name}' -> '{company_data['name']}'"
+            )
+
+        if company_data["location"] != location:
+            logger.info(
+                f"Post-processing modified location: '{location}' -> '{company_data['location']}'"
+            )
+
+        # Final validation check - name shouldn't be very short or contain location
+        if len(company_data["name"]) < 2:
+            logger.warning(
+                f"Final company name is suspiciously short: '{company_data['name']}'"
+            )
+
+        if (
+            company_data["location"]
+            and company_data["location"] in company_data["name"]
+        ):
+            logger.warning(
+                f"Final company name still contains location: '{company_data['name']}' contains '{company_data['location']}'"
+            )
+
+        # Verify data completeness
+        if not company_data["name"] or not company_data["url"]:
+            raise ValueError("Missing required company data")
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Final company data: {company_data}")
+        return company_data
 
     def _verify_company_location_separation(self, company_data):
         """Special verification for common patterns where names get attached to locations"""
@@ -1221,83 +1815,119 @@ class SeleniumYCScraper(BaseScraper):
         # Copy the data to avoid direct modification
         verified_data = company_data.copy()
 
-        # Check for department-like text in location field
+        # Check for department-like text in location field (all caps, a
+        # comma and at least three words, counted only up to the third)
         if (
-            location.upper() == location
+            location.isupper()
             and "," in location
-            and len(location.split()) >= 3
+            and len(location.split(maxsplit=2)) == 3
         ):
             # Likely a department or title, not a location
             verified_data["location"] = ""
             logger.info(f"Removed likely department name from location: '{location}'")
             return verified_data
 
-        # Fix ALL CAPS company names with international locations (e.g., "STARK BANKSão Paulo")
-        if name == name.upper() and any(ord(c) > 127 for c in name):
-            # Find transition between ASCII uppercase and accented chars
-            for i in range(len(name) - 1):
-                if ord(name[i]) < 128 and ord(name[i + 1]) > 127:
-                    # Check if we have a clean break point that's not mid-word
-                    if i > 0 and len(name[: i + 1].strip()) >= 2:
-                        verified_data["name"] = name[: i + 1].strip()
+        # Each rule splits the original name on its own and the most specific
+        # one wins, so rules are only tried until one of them applies
+        split = next(self._name_splits(name), None)
+        if split:
+            verified_data["name"], message = split
+            logger.info(message)
 
-                        # Only set location if we don't already have one
-                        if not location:
-                            verified_data["location"] = name[i + 1 :].strip()
+        # Final sanity check - if the company name contains a comma, it might still have location attached
+        if "," in verified_data["name"] and not verified_data["name"].startswith('"'):
+            parts = verified_data["name"].split(",", 1)
+            if len(parts) == 2 and len(parts[0]) >= 2:
+                verified_data["name"] = parts[0].strip()
+                logger.info(f"Split at comma: '{name}' -> '{verified_data['name']}'")
 
-                        logger.info(
-                            f"Split all-caps international name: '{name}' -> '{verified_data['name']}' + '{name[i+1:]}'"
-                        )
-                        break
+        return verified_data
 
-        # Pattern 1: CompanyNameCityName - no spaces between company and city
-        # Look for common city prefixes in the name without spaces
-        for city in self.major_cities:
-            if city in name and not f" {city}" in name:
-                city_pos = name.find(city)
-                if city_pos > 0:
-                    verified_data["name"] = name[:city_pos].strip()
-                    logger.info(
-                        f"Split city from name: '{name}' -> '{verified_data['name']}' + '{city}'"
-                    )
-                    break
+    def _name_splits(self, name):
+        """
+        Yield the company names that the separation rules split off a name
 
-        # Pattern 1.5: Enhanced city detection - find embedded city names at word boundaries
-        # This addresses cases like "OchreBioOxford" or "LivingCarbonCharleston"
-        for city in self.major_cities:
-            # Skip short city names to avoid false positives
-            if len(city) <= 3:
+        Rules come from the most to the least specific (pattern 7 down to the
+        all-caps rule), so the first split is the one that applies.
+
+        Args:
+            name (str): Company name that may have a location attached
+
+        Yields:
+            tuple: Company name and a log message describing the split
+        """
+        # Pattern 7: Bio/Health/Tech company name concatenated with location
+        # This specifically handles common patterns like: "Ochre BioOxford" or "YassirAlgeria"
+        for suffix_pattern, suffix in TECH_SUFFIX_PATTERNS:
+            # Only names containing the suffix can match, a cheap test to run
+            # before the pattern
+            if suffix not in name:
                 continue
+            # Look for patterns like CompanyNameBioLocation
+            match = suffix_pattern.search(name)
+            if match:
+                company_part = match.group(1) + match.group(2)
+                location_part = match.group(3)
 
-            # Create pattern to find city names with no space before them
-            city_pattern = r"([A-Za-z]+)(" + re.escape(city) + r")"
-            match = re.search(city_pattern, name)
+                # Verify location part against known cities
+                for city in self.major_cities:
+                    if city.startswith(location_part) or location_part in city:
+                        yield (
+                            company_part.strip(),
+                            f"Split tech suffix with location: '{name}' -> '{company_part}' + '{city}'",
+                        )
+
+        # Pattern 6: Common locations that might be appended (e.g., "CompanyUSA")
+        for region_pattern, region in REGION_SUFFIX_PATTERNS:
+            if not name.endswith(region):
+                continue
+            match = region_pattern.search(name)
             if match and match.group(1) != "":
-                # Make sure it's not just a partial match (e.g., "Manchester" in "Romanchester")
-                prefix = match.group(1)
-                if (
-                    len(prefix) >= 2 and not prefix[-1].islower()
-                ):  # Last char should be uppercase or non-alpha
-                    verified_data["name"] = prefix.strip()
-                    if not location:
-                        verified_data["location"] = city
-                    logger.info(
-                        f"Split embedded city from name: '{name}' -> '{verified_data['name']}' + '{city}'"
+                company = match.group(1).strip()
+                yield (
+                    company,
+                    f"Split region code from name: '{name}' -> '{company}' + '{region}'",
+                )
+
+        # Pattern 5: Handle single city name at the end (e.g., "CompanyNameTokyo")
+        # One scan for any city ending the name skips the per-city checks for
+        # the many names without one
+        if self._may_end_with_city(name) and self._city_end_re.search(name):
+            # The longest city ending the name starts first, so positions are
+            # tried from the left
+            for start in range(1, len(name)):
+                found = self._find_longest_city_at(name, start, fold=True)
+                if not found or found[0] != len(name):
+                    continue
+                # The company is the word the city is glued to
+                word_start = start
+                while word_start > 0 and WORD_CHAR_RE.match(name, word_start - 1):
+                    word_start -= 1
+                if word_start < start:
+                    company = name[word_start:start].strip()
+                    yield (
+                        company,
+                        f"Split single city from name: '{name}' -> '{company}' + '{found[1]}'",
                     )
-                    break
 
-        # Pattern 2: CompanyAISanFrancisco - common patterns seen in logs
-        ai_city_pattern = r"([A-Za-z]+)AI([A-Z][a-z]+(?:\s[A-Z][a-z]+)*)"
-        match = re.search(ai_city_pattern, name)
-        if match:
-            verified_data["name"] = match.group(1) + " AI"
-            logger.info(f"Split AI-city pattern: '{name}' -> '{verified_data['name']}'")
+        # Pattern 4: International city names concatenated: CompanyNameSãoPaulo
+        # Already handled by international character boundary detection, but check once more
+        # These cities all have accents, so only non-ASCII names can hold them
+        if not name.isascii():
+            normalized_name = unicodedata.normalize("NFD", name)
+            for city, normalized_city in INTERNATIONAL_CITIES:
+                city_pos = normalized_name.find(normalized_city)
+                if city_pos > 0:
+                    company = _nfd_prefix(name, normalized_name, city_pos).strip()
+                    yield (
+                        company,
+                        f"Split international city: '{name}' -> '{company}' + '{city}'",
+                    )
 
         # Pattern 3: Multi-word company names with concatenated locations
         # This handles cases like "Nomic BioMontreal" where there's a space in the company name
         # but not between company and location
-        multi_word_pattern = r"([A-Za-z]+\s+[A-Za-z]+)([A-Z][a-z]+)"
-        match = re.search(multi_word_pattern, name)
+        match = MULTI_WORD_NAME_RE.search(name)
         if match:
             company_part = match.group(1)
             location_part = match.group(2)
@@ -1305,89 +1935,101 @@ class SeleniumYCScraper(BaseScraper):
             # Verify the location part matches a known location
             for city in self.major_cities:
                 if city.startswith(location_part) or location_part == city:
-                    verified_data["name"] = company_part.strip()
-                    if not location:
-                        verified_data["location"] = city
-                    logger.info(
-                        f"Split multi-word company from location: '{name}' -> '{company_part}' + '{city}'"
+                    yield (
+                        company_part.strip(),
+                        f"Split multi-word company from location: '{name}' -> '{company_part}' + '{city}'",
                     )
-                    break
 
-        # Pattern 4: International city names concatenated: CompanyNameSãoPaulo
-        # Already handled by international character boundary detection, but check once more
-        for city in ["São Paulo", "México", "Bogotá", "Montréal"]:
-            normalized_city = unicodedata.normalize("NFD", city)
-            normalized_name = unicodedata.normalize("NFD", name)
+        # Pattern 2: CompanyAISanFrancisco - common patterns seen in logs
+        match = AI_CITY_RE.search(name)
+        if match:
+            company = match.group(1) + " AI"
+            yield company, f"Split AI-city pattern: '{name}' -> '{company}'"
+
+        # Patterns 1.5 and 1 need a city somewhere in the name, one scan skips
+        # them for the many names without one
+        if self._city_re.search(name):
+            # Pattern 1.5: Enhanced city detection - find embedded city names at word boundaries
+            # This addresses cases like "OchreBioOxford" or "LivingCarbonCharleston"
+            for city_pattern, city in self._city_prefix_patterns:
+                # A substring test is far cheaper than the pattern, and most
+                # cities are not in the name
+                if city not in name:
+                    continue
+                # Find city names with no space before them
+                match = city_pattern.search(name)
+                if match and match.group(1) != "":
+                    # Make sure it's not just a partial match (e.g., "Manchester" in "Romanchester")
+                    prefix = match.group(1)
+                    if (
+                        len(prefix) >= 2 and not prefix[-1].islower()
+                    ):  # Last char should be uppercase or non-alpha
+                        company = prefix.strip()
+                        yield (
+                            company,
+                            f"Split embedded city from name: '{name}' -> '{company}' + '{city}'",
+                        )
 
-            if normalized_city in normalized_name:
-                city_pos = normalized_name.find(normalized_city)
-                if city_pos > 0:
-                    verified_data["name"] = name[:city_pos].strip()
-                    logger.info(
-                        f"Split international city: '{name}' -> '{verified_data['name']}' + '{city}'"
+            # Pattern 1: CompanyNameCityName - no spaces between company and city
+            # Look for the first city in the name without spaces, the longest
+            # one where several start at the same position
+            for start in range(1, len(name)):
+                found = self._find_longest_city_at(name, start)
+                if not found:
+                    continue
+                city = found[1]
+                if name.find(city) == start and not f" {city}" in name:
+                    company = name[:start].strip()
+                    yield (
+                        company,
+                        f"Split city from name: '{name}' -> '{company}' + '{city}'",
                     )
-                    break
-
-        # Pattern 5: Handle single city name at the end (e.g., "CompanyNameTokyo")
-        for city in self.major_cities:
-            city_pattern = r"(\w+)(" + re.escape(city) + r")$"
-            match = re.search(city_pattern, name, re.IGNORECASE)
-            if match and match.group(1) != "":
-                verified_data["name"] = match.group(1).strip()
-                logger.info(
-                    f"Split single city from name: '{name}' -> '{verified_data['name']}' + '{city}'"
-                )
-                break
 
-        # Pattern 6: Common locations that might be appended (e.g., "CompanyUSA")
-        common_regions = ["USA", "EU", "UK", "UAE", "HK"]
-        for region in common_regions:
-            region_pattern = r"(\w+)(" + re.escape(region) + r")$"
-            match = re.search(region_pattern, name)
-            if match and match.group(1) != "":
-                verified_data["name"] = match.group(1).strip()
-                if not location:
-                    verified_data["location"] = region
-                logger.info(
-                    f"Split region code from name: '{name}' -> '{verified_data['name']}' + '{region}'"
-                )
-                break
+        # Fix ALL CAPS company names with international locations (e.g., "STARK BANKSão Paulo")
+        if not name.isascii() and name.isupper():
+            # Find transition between ASCII uppercase and accented chars
+            for match in ASCII_BOUNDARY_RE.finditer(name):
+                i = match.start()
+                # Check if we have a clean break point that's not mid-word
+                if i > 0 and len(name[: i + 1].strip()) >= 2:
+                    company = name[: i + 1].strip()
+                    yield (
+                        company,
+                        f"Split all-caps international name: '{name}' -> '{company}' + '{name[i+1:]}'",
+                    )
 
-        # Pattern 7: Bio/Health/Tech company name concatenated with location
-        # This specifically handles common patterns like: "Ochre BioOxford" or "YassirAlgeria"
-        tech_suffixes = ["Bio", "Health", "Tech", "AI", "Labs", "Med"]
-        for suffix in tech_suffixes:
-            # Look for patterns like CompanyNameBioLocation
-            suffix_pattern = r"([A-Za-z]+\s*)(" + re.escape(suffix) + r")([A-Z][a-z]+)"
-            match = re.search(suffix_pattern, name)
-            if match:
-                company_part = match.group(1) + match.group(2)
-                location_part = match.group(3)
+    def _may_end_with_city(self, name):
+        """
+        Cheap check whether a name could end with a major city, ignoring case
 
-                # Verify location part against known cities
-                is_known_location = False
-                for city in self.major_cities:
-                    if city.startswith(location_part) or location_part in city:
-                        is_known_location = True
-                        verified_data["name"] = company_part.strip()
-                        if not location:
-                            verified_data["location"] = city
-                        logger.info(
-                            f"Split tech suffix with location: '{name}' -> '{company_part}' + '{city}'"
-                        )
-                        break
+        Only decides for ASCII names, other names may still match the city
+        pattern through Unicode case folding.
+        """
+        if not name.isascii():
+            return True
+        return name[-self._city_tail_len :].lower() in self._city_tails
 
-                if is_known_location:
-                    break
+    def _find_longest_city_at(self, text, start, fold=False):
+        """
+        Find the longest known city starting at a position of a text
 
-        # Final sanity check - if the company name contains a comma, it might still have location attached
-        if "," in verified_data["name"] and not verified_data["name"].startswith('"'):
-            parts = verified_data["name"].split(",", 1)
-            if len(parts) == 2 and len(parts[0]) >= 2:
-                verified_data["name"] = parts[0].strip()
-                logger.info(f"Split at comma: '{name}' -> '{verified_data['name']}'")
+        Args:
+            text (str): Text to look in
+            start (int): Position the city has to start at
+            fold (bool): Whether to ignore case
 
-        return verified_data
+        Returns:
+            tuple: End position and the city, or None when no city starts there
+        """
+        node = self._city_trie_folded if fold else self._city_trie
+        found = None
+        for end in range(start, len(text)):
+            node = node.get(text[end].lower() if fold else text[end])
+            if node is None:
+                break
+            if None in node:
+                found = (end + 1, node[None])
+        return found
 
     def _validate_and_correct_company_data(self, company_data, raw_text):
         """
@@ -1418,8 +2060,8 @@ class SeleniumYCScraper(BaseScraper):
         # 2. Check if company name contains HTML or markdown - common scraping artifacts
         if "<" in name and ">" in name or "[" in name and "]" in name:
             # Try to extract text without HTML/markdown
-            cleaned_name = re.sub(r"<[^<]+?>", "", name)  # Remove HTML tags
-            cleaned_name = re.sub(r"\[.*?\]", "", cleaned_name)  # Remove markdown
+            cleaned_name = HTML_TAG_RE.sub("", name)  # Remove HTML tags
+            cleaned_name = MARKDOWN_LINK_RE.sub("", cleaned_name)  # Remove markdown
             if cleaned_name.strip():
                 validated_data["name"] = cleaned_name.strip()
                 logger.info(
@@ -1474,7 +2116,7 @@ class SeleniumYCScraper(BaseScraper):
         # 6. Handle international character boundaries - specific focus on cases like "STARK BANKSão Paulo"
         if name:
             # Look for transitions between ASCII and non-ASCII characters without spaces
-            int_matches = list(re.finditer(r"([A-Z][A-Z]+)([À-ÿ][a-zÀ-ÿ]+)", name))
+            int_matches = list(CAPS_ACCENT_BOUNDARY_RE.finditer(name))
 
             if int_matches:
                 for match in int_matches:
@@ -1485,9 +2127,7 @@ class SeleniumYCScraper(BaseScraper):
                     loc_confidence = self.validate_location(potential_location)
 
                     # If we have high confidence or location contains accented characters
-                    if loc_confidence > 30 or any(
-                        ord(c) > 127 for c in potential_location
-                    ):
+                    if loc_confidence > 30 or not potential_location.isascii():
                         validated_data["name"] = potential_company
 
                         # Only update location if we found a better one
@@ -1502,9 +2142,8 @@ class SeleniumYCScraper(BaseScraper):
                         break
 
             # Also check for cases where uppercase followed by accented
-            elif not int_matches and any(ord(c) > 127 for c in name):
-                ascii_pattern = r"([A-Za-z])([À-ÿ])"
-                match = re.search(ascii_pattern, name)
+            elif not int_matches and not name.isascii():
+                match = LETTER_ACCENT_BOUNDARY_RE.search(name)
                 if match:
                     split_point = match.start() + 1
                     corrected_name = name[:split_point].strip()
@@ -1523,10 +2162,9 @@ class SeleniumYCScraper(BaseScraper):
                         )
 
         # 7. Special handling for Spanish/Portuguese company names with locations
-        for city in ["São Paulo", "México City", "Bogotá", "CDMX", "Rio de Janeiro"]:
+        for pattern, city in LATAM_CITY_PATTERNS:
             if name and city in name:
                 # Case-insensitive search to catch variations
-                pattern = re.compile(re.escape(city), re.IGNORECASE)
                 match = pattern.search(name)
                 if match:
                     split_point = match.start()
@@ -1579,8 +2217,7 @@ class SeleniumYCScraper(BaseScraper):
             return text, ""
 
         # Try to identify camelcase boundaries (e.g., "CompanyNameSanFrancisco")
-        camel_case_pattern = r"([a-z])([A-Z])"
-        matches = list(re.finditer(camel_case_pattern, text))
+        matches = list(CAMEL_CASE_BOUNDARY_RE.finditer(text))
 
         if matches:
             for match in reversed(matches):  # Start from the end to find location first
@@ -1597,8 +2234,7 @@ class SeleniumYCScraper(BaseScraper):
 
         # Handle international characters at word boundaries
         # Look for transitions from lowercase to uppercase with accented chars
-        international_pattern = r"([a-z])([À-ÿ][A-Z])"
-        matches = list(re.finditer(international_pattern, text))
+        matches = list(LOWER_ACCENT_UPPER_BOUNDARY_RE.finditer(text))
 
         if matches:
             for match in reversed(matches):
@@ -1620,8 +2256,8 @@ class SeleniumYCScraper(BaseScraper):
                     return parts[0].strip(), parts[1].strip()
 
         # Try common location word identification
-        for prefix in self.common_location_prefixes:
-            if prefix in text and not text.startswith(prefix):
+        for prefix in self._location_prefixes_in(text):
+            if not text.startswith(prefix):
                 prefix_pos = text.find(prefix)
                 if prefix_pos > 0:
                     # Check if there's a word boundary before the prefix
@@ -1641,7 +2277,19 @@ class SeleniumYCScraper(BaseScraper):
         """
         Enhanced method to clean company name by properly separating from location
         Uses dynamic location data and validation to ensure proper separation
+
+        Results are memoized until the known locations change, as each
+        company's name is cleaned during extraction and again when processed.
         """
+        key = (name, location)
+        clean_name = self._clean_name_cache.get(key)
+        if clean_name is None:
+            clean_name = self._clean_company_name(name, location)
+            self._clean_name_cache.set(key, clean_name)
+        return clean_name
+
+    def _clean_company_name(self, name, location):
+        """Separate the name from the location, see clean_company_name()"""
         if not name or not location:
             return name.strip() if name else ""
 
@@ -1650,10 +2298,6 @@ class SeleniumYCScraper(BaseScraper):
             # Directly replace the location without any additional checks
             return name.replace(location, "").strip()
 
-        # Normalize text for better handling of international characters
-        normalized_name = unicodedata.normalize("NFD", name)
-        normalized_location = unicodedata.normalize("NFD", location)
-
         # Clean the location to ensure it's actually a location
         location_confidence = self.validate_location(location)
         if location_confidence < 30:
@@ -1668,6 +2312,10 @@ class SeleniumYCScraper(BaseScraper):
         if not self.known_locations:
             self.refresh_location_data()
 
+        # Most names have no location in them, skip the rules below then
+        if not self._may_contain_location(name, location):
+            return name.strip()
+
         # Special case for San Francisco being misplaced in the middle of the name
         if "San Francisco" in name and not name.endswith("San Francisco"):
             sf_pos = name.find("San Francisco")
@@ -1675,10 +2323,14 @@ class SeleniumYCScraper(BaseScraper):
                 return name[:sf_pos].strip()
 
         # Check for international cases like "STARK BANKSão Paulo"
-        # Look for transitions from ASCII to accented characters without spaces
-        int_match = re.search(r"([A-Za-z])([À-ÿ])", name)
-        if int_match:
-            split_point = int_match.start() + 1
+        # Look for transitions from ASCII to accented characters without spaces.
+        # The same transitions are tried again further down, so the name is
+        # scanned once (and not at all when it has no accents)
+        accent_matches = (
+            [] if name.isascii() else list(LETTER_ACCENT_BOUNDARY_RE.finditer(name))
+        )
+        if accent_matches:
+            split_point = accent_matches[0].start() + 1
             potential_company = name[:split_point]
             potential_location = name[split_point:]
 
@@ -1695,15 +2347,15 @@ class SeleniumYCScraper(BaseScraper):
                     return potential_company
 
         # First try the simplest case - direct replacement of location from end of name
-        name_without_location = re.sub(r"[,\s]*" + re.escape(location) + r"$", "", name)
+        name_without_location = _trailing_location_re(location).sub("", name)
         if name_without_location != name and len(name_without_location.strip()) >= 2:
             return name_without_location.strip()
 
         # Special case for concatenated international character locations
         # Look for abrupt character set changes (e.g. "STARKBANKSão Paulo")
-        matches = list(re.finditer(r"([a-zA-Z])([À-ÿ])", name))
-        if matches:
-            for match in reversed(matches):  # Start from the end for greedy matching
+        if accent_matches:
+            # Start from the end for greedy matching
+            for match in reversed(accent_matches):
                 split_point = match.start() + 1
                 potential_company = name[:split_point]
                 potential_location = name[split_point:]
@@ -1733,19 +2385,17 @@ class SeleniumYCScraper(BaseScraper):
 
         # Handle non-ASCII characters in locations
         # Try finding the location in the normalized name
-        if normalized_location in normalized_name:
-            # Get the position of location in normalized name
-            loc_start = normalized_name.find(normalized_location)
-            if loc_start > 0:
-                # Return the part before location in the original name
-                return name[:loc_start].strip()
+        normalized_name = _nfd(name)
+        loc_start = normalized_name.find(_nfd(location))
+        if loc_start > 0:
+            # Return the part before location in the original name
+            return _nfd_prefix(name, normalized_name, loc_start).strip()
 
         # Handle missing spaces between company name and location
         # Look for CamelCase patterns or sudden changes in character types
 
         # 1. Look for patterns where lowercase is followed by uppercase (CamelCase boundary)
-        camel_case_pattern = r"([a-z])([A-Z])"
-        matches = list(re.finditer(camel_case_pattern, name))
+        matches = list(CAMEL_CASE_BOUNDARY_RE.finditer(name))
         if matches:
             for match in reversed(matches):  # Check from the end first
                 split_point = match.start() + 1  # Position after the lowercase letter
@@ -1783,8 +2433,8 @@ class SeleniumYCScraper(BaseScraper):
 
         # 3. Check for company names with locations embedded in them
         # Use database-derived location prefixes instead of hardcoded list
-        for prefix in self.common_location_prefixes:
-            if prefix in name and prefix not in location:
+        for prefix in self._location_prefixes_in(name):
+            if prefix not in location:
                 # Skip if it's part of a legitimate company name at the beginning
                 if name.startswith(prefix):
                     continue
@@ -1824,17 +2474,96 @@ class SeleniumYCScraper(BaseScraper):
 
         # Last resort - if name contains location with other text
         # Try to identify a natural boundary by looking for common separators
-        for sep in [",", "-", "|", ":", ";", "•"]:
-            if sep in name:
-                parts = name.split(sep, 1)
-                if location in parts[1]:
-                    return parts[0].strip()
-                elif location in parts[0]:
-                    return parts[1].strip()
+        # (one scan finds if the name has any, most names have none)
+        if NAME_SEPARATOR_RE.search(name):
+            for sep in NAME_SEPARATORS:
+                if sep in name:
+                    parts = name.split(sep, 1)
+                    if location in parts[1]:
+                        return parts[0].strip()
+                    elif location in parts[0]:
+                        return parts[1].strip()
 
         # If we couldn't separate, just return the original name
         return name.strip()
 
+    def _location_prefixes_in(self, text):
+        """
+        Find the common location prefixes in a text with one walk of the
+        prefix trie, instead of a substring search per prefix
+
+        Args:
+            text (str): Text to look in
+
+        Returns:
+            list: Prefixes in the order they first occur in the text
+        """
+        found = {}
+        trie = self._prefix_trie
+        length = len(text)
+        # Most characters start no prefix, those cost a single dict lookup
+        for start, char in enumerate(text):
+            node = trie.get(char)
+            end = start + 1
+            while node is not None:
+                if None in node:
+                    found.setdefault(node[None], start)
+                if end == length:
+                    break
+                node = node.get(text[end])
+                end += 1
+        return list(found)
+
+    def _may_contain_location(self, name, location):
+        """
+        Cheap check whether any rule of _clean_company_name() could apply
+
+        Each test is the precondition of one or more rules, so False means
+        cleaning would return the name unchanged.
+        """
+        if location in name or not name.isascii() or "San Francisco" in name:
+            return True
+        if CAMEL_CASE_BOUNDARY_RE.search(name):
+            return True
+        # Multi-word names followed by part of the location
+        words = name.split()
+        if len(words) >= 3:
+            for i in range(1, len(words)):
+                if " ".join(words[i:]) in location:
+                    return True
+                if location in " ".join(words[i:]):
+                    return True
+        # First location word, location prefixes, or the start of the location
+        # glued to the end of the name
+        location_words = location.split()
+        if location_words and location_words[0] in name:
+            return True
+        if self._location_prefixes_in(name):
+            return True
+        return any(name.endswith(location[:i]) for i in range(1, min(len(location), 5)))
+
+    def _process_chunk(self, chunk):
+        """
+        Process raw startups into a standardized format, skipping failures
+
+        Args:
+            chunk (list): Raw startup data
+
+        Returns:
+            list: Processed startup data
+        """
+        processed_chunk = []
+        for raw_startup_data in chunk:
+            try:
+                processed_chunk.append(
+                    self.process_startup_data_cached(raw_startup_data)
+                )
+            except Exception as e:
+                logger.error(
+                    f"Failed to save startup {raw_startup_data.get('name', 'Unknown')}: {e}"
+                )
+        return processed_chunk
+
     def process_startup_data(self, raw_data):
         """
         Process raw startup data into a standardized format
@@ -1845,11 +2574,13 @@ class SeleniumYCScraper(BaseScraper):
         Returns:
             dict: Processed startup data in standardized format
         """
-        # Extract year from batch (e.g., "W24" -> 2024)
-        batch = raw_data.get("batch", "")
-        year_founded = (
-            self._extract_year_from_batch(batch) if batch else datetime.now().year
-        )
+        # Extract year from batch (e.g., "W24" -> 2024), anything that is not a
+        # batch code would not fit the batch column
+        raw_batch = raw_data.get("batch")
+        batch = self._batch_code(raw_batch) or ""
+        if raw_batch and not batch:
+            logger.warning(f"Dropping unknown batch '{raw_batch}'")
+        year_founded = self._extract_year_from_batch(batch)
 
         # Process location
         location = raw_data.get("location", "")
@@ -1860,10 +2591,10 @@ class SeleniumYCScraper(BaseScraper):
             # Use our improved clean_company_name method instead of simple replacement
             name = self.clean_company_name(name, location)
 
-        # Convert tags from list to comma-separated string if needed
+        # Convert tags from a comma-separated string to a list if needed
         tags = raw_data.get("tags", [])
-        if isinstance(tags, list):
-            tags = ",".join(tags) if tags else ""
+        if isinstance(tags, str):
+            tags = [tag.strip() for tag in tags.split(",") if tag.strip()]
 
         # Convert team size to integer if possible
         team_size = raw_data.get("team_size", "")
@@ -1891,69 +2622,87 @@ class SeleniumYCScraper(BaseScraper):
 
         return startup_data
 
-    def _save_startup_to_db(self, startup_data):
+    def _load_existing_startups(self, startups):
+        """
+        Load the saved startups matching processed startup data in one query
+
+        Startups are matched by name and batch, their founders are loaded
+        along with them in one more query.
+
+        Args:
+            startups (list): Processed startup data
+
+        Returns:
+            dict: Startup objects keyed by name and batch
         """
-        Save startup data to database, tracking if it's new or updated
+        keys = {
+            (startup["name"], startup.get("batch"))
+            for startup in startups
+            if "name" in startup
+        }
+        with_batch = [key for key in keys if key[1] is not None]
+        without_batch = [name for name, batch in keys if batch is None]
+
+        # Tuple IN cannot match a NULL batch, those are matched by name
+        conditions = []
+        if with_batch:
+            conditions.append(tuple_(Startup.name, Startup.batch).in_(with_batch))
+        if without_batch:
+            conditions.append(
+                and_(Startup.name.in_(without_batch), Startup.batch.is_(None))
+            )
+        if not conditions:
+            return {}
+
+        return {
+            (startup.name, startup.batch): startup
+            for startup in Startup.query.filter(or_(*conditions))
+        }
+
+    def _prepare_startup(self, startup_data, existing_startup=None):
+        """
+        Stage startup data in the session, tracking if it's new or updated
+
+        Nothing is committed, the caller commits staged startups in chunks.
 
         Args:
-            startup_data (dict): Processed startup data
+            startup_data (dict): Processed startup data, modified in place
+            existing_startup (Startup, optional): Saved startup with the same
+                name and batch, see _load_existing_startups()
 
         Returns:
             tuple: (Startup object, bool indicating if created)
         """
+        # Same data as last saved, nothing to compare field by field
+        content_hash = self._content_hash(startup_data)
+        if existing_startup and existing_startup.content_hash == content_hash:
+            self.stats["unchanged"] += 1
+            return existing_startup, False
+
         # Extract founders info (if any)
         founders_data = startup_data.pop("founders", [])
 
         # Basic validation for year_founded
         if startup_data.get("year_founded") is None:
-            batch = startup_data.get("batch", "")
-            startup_data["year_founded"] = (
-                self._extract_year_from_batch(batch) if batch else datetime.now().year
-            )
-
-            batch = startup_data.get("batch", "")
-            startup_data["year_founded"] = (
-                self._extract_year_from_batch(batch) if batch else datetime.now().year
+            startup_data["year_founded"] = self._extract_year_from_batch(
+                startup_data.get("batch")
             )
 
-        # Debug print raw data
-        print("\n=== Debug: Raw Startup Data ===")
-        print(f"Name: {startup_data.get('name')}")
-        print(f"Description: {startup_data.get('description')}")
-        print(f"Location: {startup_data.get('location')}")
-        print(f"Team Size: {startup_data.get('team_size')}")
-        print(f"Tags: {startup_data.get('tags')}")
-        print(f"Status: {startup_data.get('status')}")
-        print(f"Batch: {startup_data.get('batch')}")
-        print(f"Year Founded: {startup_data.get('year_founded')}")
-        print(f"URL: {startup_data.get('url')}")
-        print(f"Logo URL: {startup_data.get('logo_url')}")
-        print("=============================\n")
-
-        # Check if startup already exists (by name and batch/year)
-        existing_startup = Startup.query.filter_by(
-            name=startup_data["name"], batch=startup_data.get("batch")
-        ).first()
+        # Per-startup trace, only formatted when debug logging is on
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(f"Raw startup data: {startup_data}")
 
         is_updated = False
         is_created = False
 
         if existing_startup:
-            # Debug print existing startup data
-            print("\n=== Debug: Existing Startup Data ===")
-            print(f"Existing Name: {existing_startup.name}")
-            print(f"Existing Team Size: {existing_startup.team_size}")
-            print(f"Existing Founders Count: {len(existing_startup.founders)}")
-            print(f"Existing Tags: {existing_startup.tags}")
-            print("=============================\n")
-
-            # Make sure year_founded is set for existing startups
-            if startup_data.get("year_founded") is None:
-                batch = startup_data.get("batch", "")
-                startup_data["year_founded"] = (
-                    self._extract_year_from_batch(batch)
-                    if batch
-                    else datetime.now().year
+            if debug:
+                logger.debug(
+                    f"Existing startup: {existing_startup.name}, "
+                    f"team size {existing_startup.team_size}, "
+                    f"{len(existing_startup.founders)} founders, "
+                    f"tags {existing_startup.tags}"
                 )
 
             # Check if any data has changed
@@ -1961,59 +2710,51 @@ class SeleniumYCScraper(BaseScraper):
             for key, value in startup_data.items():
                 current_value = getattr(existing_startup, key)
                 if current_value != value:
-                    print(f"\n=== Debug: Data Change Detected ===")
-                    print(f"Field: {key}")
-                    print(f"Old Value: {current_value}")
-                    print(f"New Value: {value}")
-                    print("=============================\n")
+                    if debug:
+                        logger.debug(f"Changed {key}: {current_value!r} -> {value!r}")
                     setattr(existing_startup, key, value)
                     data_changed = True
 
             if data_changed:
-                print(f"Updating existing startup: {startup_data['name']}")
+                if debug:
+                    logger.debug(f"Updating existing startup: {startup_data['name']}")
                 is_updated = True
-            else:
-                print(f"Startup unchanged: {startup_data['name']}")
+            elif debug:
+                logger.debug(f"Startup unchanged: {startup_data['name']}")
 
             startup = existing_startup
         else:
-            print(f"Creating new startup: {startup_data['name']}")
+            if debug:
+                logger.debug(f"Creating new startup: {startup_data['name']}")
             # Create new startup
-            if startup_data.get("year_founded") is None:
-                # Extract year from batch
-                batch = startup_data.get("batch", "")
-                startup_data["year_founded"] = (
-                    self._extract_year_from_batch(batch)
-                    if batch
-                    else datetime.now().year
-                )
-
             startup = Startup(**startup_data)
             db.session.add(startup)
             is_created = True
 
-        # We need to flush to get the startup ID for founders
-        db.session.flush()
+        startup.content_hash = content_hash
+
+        # Founders already saved for this startup, by name
+        existing_founders = (
+            {founder.name: founder for founder in startup.founders}
+            if existing_startup
+            else {}
+        )
 
         # Process founders (if any)
         for founder_data in founders_data:
             # Check if founder already exists for this startup
-            existing_founder = Founder.query.filter_by(
-                name=founder_data["name"], startup_id=startup.id
-            ).first()
-
+            existing_founder = existing_founders.get(founder_data["name"])
             if existing_founder:
                 # Check if founder data has changed
                 founder_changed = False
                 for key, value in founder_data.items():
                     current_value = getattr(existing_founder, key)
                     if current_value != value:
-                        print(f"\n=== Debug: Founder Data Change Detected ===")
-                        print(f"Founder: {founder_data['name']}")
-                        print(f"Field: {key}")
-                        print(f"Old Value: {current_value}")
-                        print(f"New Value: {value}")
-                        print("=============================\n")
+                        if debug:
+                            logger.debug(
+                                f"Changed {key} of founder {founder_data['name']}: "
+                                f"{current_value!r} -> {value!r}"
+                            )
                         setattr(existing_founder, key, value)
                         founder_changed = True
 
@@ -2023,27 +2764,20 @@ class SeleniumYCScraper(BaseScraper):
                     )
             else:
                 # Create new founder
-                print(f"\n=== Debug: Creating New Founder ===")
-                print(f"Founder: {founder_data['name']}")
-                print(f"Title: {founder_data.get('title')}")
-                print(f"Role Type: {founder_data.get('role_type')}")
-                print("=============================\n")
-
-                new_founder = Founder(**founder_data)
-                new_founder.startup_id = startup.id
-                db.session.add(new_founder)
+                if debug:
+                    logger.debug(
+                        f"Creating new founder: {founder_data['name']}, "
+                        f"{founder_data.get('title')} ({founder_data.get('role_type')})"
+                    )
+
+                # Attached through the relationship, so no flush is needed
+                # to know the startup id
+                startup.founders.append(Founder(**founder_data))
                 if not is_updated and not is_created:
                     is_updated = True  # Mark as updated if we're adding a new founder
 
-        # Debug print before commit
-        print("\n=== Debug: Before Database Commit ===")
-        print(f"Startup: {startup.name}")
-        print(f"Team Size: {startup.team_size}")
-        print(f"Founders Count: {len(startup.founders)}")
-        print(f"Tags: {startup.tags}")
-        print("=============================\n")
-
-        db.session.commit()
+        # Write the staged rows so a bad record fails before it is counted
+        db.session.flush()
 
         # Update statistics based on outcome
         if is_created:
@@ -2065,26 +2799,17 @@ class SeleniumYCScraper(BaseScraper):
         Returns:
             int: Full year (e.g., 2024, 2020), or current year if not found
         """
-        if not batch or len(batch) < 3:
-            return datetime.now().year  # Default to current year
-
-        try:
-            # Extract the numeric part
-            year_part = batch[-2:]  # Get the last two chars
-            if not year_part.isdigit():
-                return datetime.now().year
-
-            # Validate the batch prefix is one of the known types
-            prefix = batch[0]
-            if prefix not in ["W", "S", "F", "X"]:
+        # The last two chars are the year ("20XX"), read as ASCII digit codes
+        if batch and len(batch) >= 3:
+            tens = ord(batch[-2]) - 48
+            ones = ord(batch[-1]) - 48
+            if 0 <= tens <= 9 and 0 <= ones <= 9:
+                # Validate the batch prefix is one of the known types
+                if batch[0] in BATCH_SEASONS:
+                    return 2000 + tens * 10 + ones
                 logger.warning(
                     f"Unknown batch prefix in '{batch}', defaulting to current year"
                 )
-                return datetime.now().year
-
-            # Convert to 4-digit year (20XX for batch strings in 2000s)
-            year = int(f"20{year_part}")
-            return year
-        except (ValueError, IndexError):
-            # If any errors, return current year
-            return datetime.now().year
+
+        # Default to current year, only looked up when the batch has no year
+        return datetime.now().year
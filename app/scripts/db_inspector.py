@@ -141,9 +141,8 @@ def display_startup_info(startup):
     # Company Details
     print("\nCOMPANY DETAILS:")
     print(f"Team Size: {startup.team_size if startup.team_size else 'Not specified'}")
-    if startup.tags and isinstance(startup.tags, str):
-        tag_list = startup.tags.split(",")
-        print(f"Tags: {', '.join(tag_list)}")
+    if startup.tags:
+        print(f"Tags: {', '.join(startup.tags)}")
     else:
         print(f"Tags: None")
 
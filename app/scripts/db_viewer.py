@@ -179,8 +179,8 @@ def main():
             print(format_text(f"Location: {location_text}", Colors.CYAN, args))
 
             # Display tags as comma-separated values if available
-            if s.tags and isinstance(s.tags, str):
-                print(f"Tags: {s.tags}")
+            if s.tags:
+                print(f"Tags: {', '.join(s.tags)}")
             else:
                 print("Tags: None")
 
@@ -0,0 +1,92 @@
+import os
+import logging
+
+from flask import current_app, has_app_context
+
+try:
+    from celery import Celery
+except ImportError:  # Celery is optional, scrapers fall back to the thread pool
+    Celery = None
+
+from app.models.db import db
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", os.getenv("REDIS_URL"))
+
+# Only queue through Celery when it is installed and a broker is configured.
+# Run a worker with: celery -A app.tasks.celery_app worker
+celery_app = (
+    Celery("startups", broker=CELERY_BROKER_URL, backend=CELERY_BROKER_URL)
+    if Celery and CELERY_BROKER_URL
+    else None
+)
+
+_flask_app = None
+
+
+def _get_flask_app():
+    """Get the Flask app to run tasks in, creating one inside a worker process"""
+    global _flask_app
+    if has_app_context():
+        return current_app._get_current_object()
+    if _flask_app is None:
+        from app import create_app
+
+        _flask_app = create_app()
+    return _flask_app
+
+
+if celery_app is not None:
+
+    @celery_app.task(bind=True, max_retries=3)
+    def run_scraper_task(self, scraper_name, year=None):
+        """
+        Run a scraper on a Celery worker, retrying with exponential backoff
+
+        Args:
+            scraper_name (str): Key of the scraper in the admin scraper map
+            year (int, optional): Filter startups by year
+
+        Returns:
+            int: Number of startups processed
+        """
+        # Imported here to avoid a circular import with the admin blueprint
+        from app.api.admin_routes import execute_scraper
+
+        with _get_flask_app().app_context():
+            try:
+                return execute_scraper(scraper_name, year, task_id=self.request.id)
+            except Exception as e:
+                db.session.rollback()
+                logger.error(f"Error in scraper task {scraper_name}: {str(e)}")
+                raise self.retry(exc=e, countdown=60 * 2**self.request.retries)
+
+    @celery_app.task(bind=True, max_retries=3)
+    def collect_data_task(self, source, year=None, force=False):
+        """
+        Run a data collection on a Celery worker, retrying with exponential backoff
+
+        Args:
+            source (str): "YC", "Neo", "TechStars" or "all"
+            year (int, optional): Filter startups by year
+            force (bool): Collect even if a recent update exists
+
+        Returns:
+            dict: Number of startups processed and the sources processed
+        """
+        # Imported here to avoid a circular import with the admin blueprint
+        from app.api.admin_routes import execute_collection
+
+        with _get_flask_app().app_context():
+            try:
+                return execute_collection(source, year, force, task_id=self.request.id)
+            except Exception as e:
+                db.session.rollback()
+                logger.error(f"Error in collection task {source}: {str(e)}")
+                raise self.retry(exc=e, countdown=60 * 2**self.request.retries)
+
+else:
+    run_scraper_task = None
+    collect_data_task = None
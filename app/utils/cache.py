@@ -0,0 +1,182 @@
+import os
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from functools import wraps
+
+from flask import current_app, make_response, request
+
+try:
+    import redis
+except ImportError:  # Caching is optional
+    redis = None
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class RedisCache:
+    """
+    Small cache-aside wrapper around a synchronous Redis client
+
+    Every lookup is a miss when no Redis URL is configured, the redis package
+    is not installed, or the server cannot be reached, so the API keeps working
+    (uncached) without Redis.
+    """
+
+    def __init__(self, url=None):
+        self.client = redis.Redis.from_url(url) if url and redis else None
+
+    def get(self, key):
+        """Get a cached value, or None on a miss"""
+        if self.client is None:
+            return None
+        try:
+            return self.client.get(key)
+        except redis.RedisError as e:
+            logger.warning(f"Cache get failed for {key}: {e}")
+            return None
+
+    def set(self, key, value, expire=300):
+        """Store a value for `expire` seconds"""
+        if self.client is None:
+            return
+        try:
+            self.client.set(key, value, ex=expire)
+        except redis.RedisError as e:
+            logger.warning(f"Cache set failed for {key}: {e}")
+
+    def delete_pattern(self, pattern):
+        """Delete every key matching a glob-style pattern"""
+        if self.client is None:
+            return
+        try:
+            keys = list(self.client.scan_iter(match=pattern))
+            if keys:
+                self.client.delete(*keys)
+        except redis.RedisError as e:
+            logger.warning(f"Cache delete failed for {pattern}: {e}")
+
+
+cache = RedisCache(os.getenv("REDIS_URL"))
+
+
+class LRUCache:
+    """
+    Small in-memory cache that evicts the least recently used entry when full
+
+    Safe to share between threads (e.g. the batch workers of one scraper).
+    """
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Get a cached value, or `default` on a miss"""
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return default
+            return self._data[key]
+
+    def set(self, key, value):
+        """Store a value, evicting the oldest entry if the cache is full"""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """Drop every entry"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+def cached(prefix, expire=300, key_builder=None):
+    """
+    Cache the JSON body of successful responses from a view
+
+    On a hit the stored body is returned as-is, skipping the database query
+    and serialization entirely.
+
+    Args:
+        prefix (str): Key prefix, used for invalidation
+        expire (int): Time to live in seconds
+        key_builder (callable, optional): Builds the key suffix, defaults to the
+            request path including the query string
+    """
+
+    def decorator(view_function):
+        @wraps(view_function)
+        def decorated_function(*args, **kwargs):
+            key = f"{prefix}:{key_builder() if key_builder else request.full_path}"
+
+            body = cache.get(key)
+            if body is not None:
+                return current_app.response_class(body, mimetype="application/json")
+
+            response = make_response(view_function(*args, **kwargs))
+            if response.status_code == 200:
+                cache.set(key, response.get_data(), expire=expire)
+            return response
+
+        return decorated_function
+
+    return decorator
+
+
+def invalidate_startup_cache():
+    """Drop all cached startup and year responses after data changes"""
+    cache.delete_pattern("startups:*")
+    cache.delete_pattern("years:*")
+    cache.delete_pattern("etag:*")
+
+
+def add_http_caching(blueprint, max_age=60, expire=300):
+    """
+    Add ETag and Cache-Control headers to successful GET responses
+
+    The ETag is a hash of the body. It is also remembered in Redis per URL so a
+    matching If-None-Match gets a 304 before the view touches the database.
+
+    Args:
+        blueprint: Flask blueprint whose GET routes should be cached
+        max_age (int): Seconds clients and CDNs may reuse a response
+        expire (int): Time to live of the remembered ETags in seconds
+    """
+
+    @blueprint.before_request
+    def check_etag():
+        if request.method != "GET" or not request.if_none_match:
+            return None
+
+        etag = cache.get(f"etag:{request.full_path}")
+        if etag is not None and request.if_none_match.contains(etag.decode()):
+            response = current_app.response_class(status=304)
+            response.set_etag(etag.decode())
+            response.cache_control.public = True
+            response.cache_control.max_age = max_age
+            return response
+        return None
+
+    @blueprint.after_request
+    def set_etag(response):
+        if request.method != "GET" or response.status_code != 200:
+            return response
+
+        etag = hashlib.blake2b(response.get_data(), digest_size=16).hexdigest()
+        cache.set(f"etag:{request.full_path}", etag, expire=expire)
+
+        response.set_etag(etag)
+        response.cache_control.public = True
+        response.cache_control.max_age = max_age
+        # Turns the response into a 304 when If-None-Match matches
+        return response.make_conditional(request)
@@ -0,0 +1,41 @@
+import orjson
+from flask import current_app
+from flask.json.provider import DefaultJSONProvider
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that encodes with orjson instead of the stdlib json module"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=ORJSON_OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Skip the str round trip, orjson already produces bytes
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=ORJSON_OPTIONS),
+            mimetype=self.mimetype,
+        )
+
+
+def json_response(data, status=200):
+    """
+    Build a JSON response directly with orjson
+
+    Args:
+        data: JSON-serializable response body
+        status (int): HTTP status code
+
+    Returns:
+        Response: The JSON response
+    """
+    return current_app.response_class(
+        orjson.dumps(data, option=ORJSON_OPTIONS),
+        status=status,
+        mimetype="application/json",
+    )
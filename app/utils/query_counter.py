@@ -0,0 +1,95 @@
+import logging
+from contextlib import contextmanager
+
+from flask import g, has_request_context, request
+from sqlalchemy import event
+
+from app.models.db import db
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+@contextmanager
+def count_queries(connectable):
+    """
+    Record every SQL statement executed on an engine or connection
+
+    Usage:
+        with count_queries(db.engine) as queries:
+            client.get("/api/startups?per_page=50")
+        assert len(queries) <= 3
+
+    Args:
+        connectable: SQLAlchemy engine or connection to listen on
+
+    Yields:
+        list: Executed statements, filled in as they run
+    """
+    queries = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        queries.append(statement)
+
+    event.listen(connectable, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield queries
+    finally:
+        event.remove(connectable, "before_cursor_execute", before_cursor_execute)
+
+
+@contextmanager
+def assert_max_queries(limit, connectable=None):
+    """
+    Fail if a block executes more than `limit` SQL statements
+
+    Usage:
+        with assert_max_queries(2):
+            client.get("/api/startups?per_page=50")
+
+    Args:
+        limit (int): Maximum number of statements allowed
+        connectable: Engine or connection to listen on, defaults to db.engine
+
+    Raises:
+        AssertionError: If more statements were executed, listing them
+    """
+    with count_queries(connectable or db.engine) as queries:
+        yield queries
+
+    if len(queries) > limit:
+        raise AssertionError(
+            f"Expected at most {limit} queries, {len(queries)} were executed:\n"
+            + "\n".join(queries)
+        )
+
+
+def init_query_counter(app):
+    """
+    Log requests that execute more queries than QUERY_COUNT_WARNING
+
+    Helps catch N+1 regressions (e.g. a new lazy-loaded relationship in a
+    schema). Disabled when the setting is 0.
+
+    Args:
+        app: Flask application
+    """
+    threshold = app.config.get("QUERY_COUNT_WARNING", 0)
+    if not threshold:
+        return
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        if has_request_context():
+            g.query_count = g.get("query_count", 0) + 1
+
+    with app.app_context():
+        event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+
+    @app.after_request
+    def log_query_count(response):
+        query_count = g.get("query_count", 0)
+        if query_count > threshold:
+            logger.warning(
+                f"{request.method} {request.full_path} executed {query_count} queries"
+            )
+        return response
@@ -57,18 +57,19 @@ def should_run_full_update(source="YC", interval_months=3, db=None):
         return True  # Default to running on error
 
 
-def create_scraper_run(source, db):
+def create_scraper_run(source, db, task_id=None):
     """
     Create and return a new scraper run record
 
     Args:
         source (str): Source identifier (YC, Neo, etc.)
         db: SQLAlchemy database instance
+        task_id (str, optional): Id of the queued task running the scraper
 
     Returns:
         ScraperRun: The created run record
     """
-    run = ScraperRun(source=source)
+    run = ScraperRun(source=source, task_id=task_id)
     db.session.add(run)
     db.session.commit()
     return run
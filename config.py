@@ -13,8 +13,19 @@ class Config:
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SECRET_KEY = os.getenv("SECRET_KEY", "dev")
 
+    # Log requests running more queries than this (0 disables the check)
+    QUERY_COUNT_WARNING = int(os.getenv("QUERY_COUNT_WARNING", "0"))
+
     # Ensure SQLite uses absolute paths
     if SQLALCHEMY_DATABASE_URI.startswith("sqlite:///"):
         SQLALCHEMY_DATABASE_URI = SQLALCHEMY_DATABASE_URI.replace(
             "sqlite:///", f"sqlite:///{os.path.join(basedir, '')}"
         )
+
+    # Connections per process, shared by API requests and scraper writes
+    if not SQLALCHEMY_DATABASE_URI.startswith("sqlite"):
+        SQLALCHEMY_ENGINE_OPTIONS = {
+            "pool_size": int(os.getenv("DB_POOL_SIZE", "5")),
+            "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "5")),
+            "pool_pre_ping": True,
+        }
@@ -0,0 +1,72 @@
+"""store startup tags as an array
+
+Revision ID: 70bc8287638e
+Revises: d15efc23b1ed
+Create Date: 2026-10-15 22:51:50.074177
+
+"""
+import json
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '70bc8287638e'
+down_revision = 'd15efc23b1ed'
+branch_labels = None
+depends_on = None
+
+
+startups = sa.table('startups', sa.column('id', sa.Integer), sa.column('tags', sa.Text))
+
+
+def _rewrite_tags(convert):
+    """Rewrite the stored tags of every startup (SQLite only)"""
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.select(startups.c.id, startups.c.tags).where(startups.c.tags.isnot(None))
+    ).all()
+    for startup_id, tags in rows:
+        bind.execute(
+            startups.update().where(startups.c.id == startup_id).values(tags=convert(tags))
+        )
+
+
+def upgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.alter_column(
+            'startups', 'tags',
+            existing_type=sa.String(length=255),
+            type_=postgresql.ARRAY(sa.String(length=64)),
+            postgresql_using="string_to_array(NULLIF(tags, ''), ',')::varchar(64)[]",
+        )
+        op.create_index('ix_startups_tags_gin', 'startups', ['tags'], unique=False, postgresql_using='gin')
+    else:
+        # Comma-separated strings become JSON lists
+        _rewrite_tags(lambda tags: json.dumps([t.strip() for t in tags.split(',') if t.strip()]))
+        with op.batch_alter_table('startups', schema=None) as batch_op:
+            batch_op.alter_column('tags', existing_type=sa.String(length=255), type_=sa.JSON())
+
+    with op.batch_alter_table('startups', schema=None) as batch_op:
+        batch_op.alter_column('batch', existing_type=sa.String(length=10), type_=sa.String(length=8), existing_nullable=True)
+        batch_op.alter_column('status', existing_type=sa.String(length=20), type_=sa.String(length=10), existing_nullable=True)
+
+
+def downgrade():
+    with op.batch_alter_table('startups', schema=None) as batch_op:
+        batch_op.alter_column('status', existing_type=sa.String(length=10), type_=sa.String(length=20), existing_nullable=True)
+        batch_op.alter_column('batch', existing_type=sa.String(length=8), type_=sa.String(length=10), existing_nullable=True)
+
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('ix_startups_tags_gin', table_name='startups', postgresql_using='gin')
+        op.alter_column(
+            'startups', 'tags',
+            existing_type=postgresql.ARRAY(sa.String(length=64)),
+            type_=sa.String(length=255),
+            postgresql_using="array_to_string(tags, ',')",
+        )
+    else:
+        with op.batch_alter_table('startups', schema=None) as batch_op:
+            batch_op.alter_column('tags', existing_type=sa.JSON(), type_=sa.String(length=255))
+        _rewrite_tags(lambda tags: ','.join(json.loads(tags)))
@@ -0,0 +1,33 @@
+"""require a startup for every founder
+
+Revision ID: 7fd8e4eadeb5
+Revises: dc707001769a
+Create Date: 2026-10-15 22:58:01.759587
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7fd8e4eadeb5'
+down_revision = 'dc707001769a'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Founders left behind by startup deletes before the cascade belong to no startup
+    op.execute('DELETE FROM founders WHERE startup_id IS NULL')
+
+    with op.batch_alter_table('founders', schema=None) as batch_op:
+        batch_op.alter_column('startup_id',
+               existing_type=sa.INTEGER(),
+               nullable=False)
+
+
+def downgrade():
+    with op.batch_alter_table('founders', schema=None) as batch_op:
+        batch_op.alter_column('startup_id',
+               existing_type=sa.INTEGER(),
+               nullable=True)
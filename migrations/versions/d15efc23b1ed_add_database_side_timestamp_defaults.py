@@ -0,0 +1,41 @@
+"""add database side timestamp defaults
+
+Revision ID: d15efc23b1ed
+Revises: d54589ec8589
+Create Date: 2026-10-15 22:49:14.170330
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd15efc23b1ed'
+down_revision = 'd54589ec8589'
+branch_labels = None
+depends_on = None
+
+
+def _utcnow():
+    # Same SQL as app.models.db.utcnow
+    if op.get_bind().dialect.name == 'postgresql':
+        return sa.text("TIMEZONE('utc', CURRENT_TIMESTAMP)")
+    return sa.text('CURRENT_TIMESTAMP')
+
+
+def upgrade():
+    with op.batch_alter_table('startups', schema=None) as batch_op:
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(), server_default=_utcnow())
+        batch_op.alter_column('updated_at', existing_type=sa.DateTime(), server_default=_utcnow())
+
+    with op.batch_alter_table('founders', schema=None) as batch_op:
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(), server_default=_utcnow())
+
+
+def downgrade():
+    with op.batch_alter_table('founders', schema=None) as batch_op:
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(), server_default=None)
+
+    with op.batch_alter_table('startups', schema=None) as batch_op:
+        batch_op.alter_column('updated_at', existing_type=sa.DateTime(), server_default=None)
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(), server_default=None)
@@ -0,0 +1,46 @@
+"""cascade founder deletes
+
+Revision ID: dc707001769a
+Revises: 70bc8287638e
+Create Date: 2026-10-15 22:53:22.500519
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'dc707001769a'
+down_revision = '70bc8287638e'
+branch_labels = None
+depends_on = None
+
+
+# SQLite foreign keys are unnamed, batch mode names them with this convention
+naming_convention = {
+    'fk': 'fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s',
+}
+
+
+def _replace_startup_fk(ondelete):
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_constraint('founders_startup_id_fkey', 'founders', type_='foreignkey')
+        op.create_foreign_key(
+            'founders_startup_id_fkey', 'founders', 'startups',
+            ['startup_id'], ['id'], ondelete=ondelete,
+        )
+    else:
+        with op.batch_alter_table('founders', naming_convention=naming_convention) as batch_op:
+            batch_op.drop_constraint('fk_founders_startup_id_startups', type_='foreignkey')
+            batch_op.create_foreign_key(
+                'fk_founders_startup_id_startups', 'startups',
+                ['startup_id'], ['id'], ondelete=ondelete,
+            )
+
+
+def upgrade():
+    _replace_startup_fk('CASCADE')
+
+
+def downgrade():
+    _replace_startup_fk(None)
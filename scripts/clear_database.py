@@ -70,16 +70,16 @@ def clear_database(confirm=True, keep_runs=False):
             # Delete records in the correct order to avoid foreign key constraint errors
             # Start with founders (child records) before startups (parent records)
             founder_count = Founder.query.count()
-            db.session.query(Founder).delete()
+            db.session.query(Founder).delete(synchronize_session=False)
             print(f"Deleted {founder_count} founder records")
 
             startup_count = Startup.query.count()
-            db.session.query(Startup).delete()
+            db.session.query(Startup).delete(synchronize_session=False)
             print(f"Deleted {startup_count} startup records")
 
             if not keep_runs:
                 run_count = ScraperRun.query.count()
-                db.session.query(ScraperRun).delete()
+                db.session.query(ScraperRun).delete(synchronize_session=False)
                 print(f"Deleted {run_count} scraper run records")
             else:
                 print("Keeping scraper run history as requested")
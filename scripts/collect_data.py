@@ -11,8 +11,10 @@ import os
 import sys
 import argparse
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dotenv import load_dotenv
+from flask import current_app
 
 # Add the parent directory to sys.path to allow imports from the app
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -107,7 +109,7 @@ def save_startup_data(startup_data):
     return startup
 
 
-def collect_yc_data(year=None, force=False):
+def collect_yc_data(year=None, force=False, task_id=None):
     """Collect data from Y Combinator using Selenium scraper"""
     # Check if we should run the update
     if not force and not should_run_full_update(source="YC", db=db):
@@ -116,6 +118,7 @@ def collect_yc_data(year=None, force=False):
 
     logger.info(f"Collecting YC data for {'all years' if year is None else year}")
     scraper = SeleniumYCScraper()
+    scraper.task_id = task_id
 
     # Fetch startups - tracking is handled inside the scraper
     startups = scraper.fetch_startups(year, track_run=True)
@@ -128,7 +131,7 @@ def collect_yc_data(year=None, force=False):
     return len(startups)
 
 
-def collect_neo_data(year=None, force=False):
+def collect_neo_data(year=None, force=False, task_id=None):
     """Collect data from Neo (placeholder)"""
     # Check if we should run the update
     if not force and not should_run_full_update(source="Neo", db=db):
@@ -140,7 +143,7 @@ def collect_neo_data(year=None, force=False):
     return 0
 
 
-def collect_techstars_data(year=None, force=False):
+def collect_techstars_data(year=None, force=False, task_id=None):
     """Collect data from TechStars (placeholder)"""
     # Check if we should run the update
     if not force and not should_run_full_update(source="TechStars", db=db):
@@ -152,6 +155,44 @@ def collect_techstars_data(year=None, force=False):
     return 0
 
 
+# Collection functions mapped to their source names
+COLLECTORS = {
+    "YC": collect_yc_data,
+    "Neo": collect_neo_data,
+    "TechStars": collect_techstars_data,
+}
+
+
+def collect_sources(sources, year=None, force=False, task_id=None):
+    """
+    Collect data from several sources at once, each on its own thread
+
+    Scrapers mostly wait on the network, so the total time is that of the
+    slowest source instead of the sum of all of them. Must be called inside
+    an app context.
+
+    Args:
+        sources (list): Source names, keys of COLLECTORS
+        year (int, optional): Year to filter by
+        force (bool): Collect even if a recent update exists
+        task_id (str, optional): Id of the queued task running the collection
+
+    Returns:
+        dict: Number of startups processed per source
+    """
+    app = current_app._get_current_object()
+
+    def collect(source):
+        # Each thread needs its own app context (and database session)
+        with app.app_context():
+            return COLLECTORS[source](year, force, task_id=task_id)
+
+    with ThreadPoolExecutor(max_workers=len(sources)) as pool:
+        counts = pool.map(collect, sources)
+
+    return dict(zip(sources, counts))
+
+
 def check_update_status():
     """Check if updates are needed for each source"""
     results = {}
@@ -204,16 +245,13 @@ def main():
                 )
             return
 
-        total_startups = 0
-
-        if args.source == "yc" or args.source == "all":
-            total_startups += collect_yc_data(args.year, args.force)
-
-        if args.source == "neo" or args.source == "all":
-            total_startups += collect_neo_data(args.year, args.force)
+        if args.source == "all":
+            sources = list(COLLECTORS)
+        else:
+            sources = [name for name in COLLECTORS if name.lower() == args.source]
 
-        if args.source == "techstars" or args.source == "all":
-            total_startups += collect_techstars_data(args.year, args.force)
+        counts = collect_sources(sources, args.year, args.force)
+        total_startups = sum(counts.values())
 
         logger.info(f"Data collection completed. Total startups: {total_startups}")
 
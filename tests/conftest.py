@@ -0,0 +1,76 @@
+import pytest
+
+from app import create_app
+from app.models.db import db
+from app.models.startup import Startup, Founder
+from app.utils import query_counter
+from config import Config
+
+
+class TestConfig(Config):
+    SQLALCHEMY_DATABASE_URI = "sqlite://"
+    SQLALCHEMY_ENGINE_OPTIONS = {}
+    TESTING = True
+    QUERY_COUNT_WARNING = 0
+
+
+@pytest.fixture
+def app():
+    """Application with an empty in-memory database"""
+    app = create_app(TestConfig)
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def seed_startups(app):
+    """
+    Add startups with founders to the database
+
+    Returns:
+        callable: Called as seed_startups(count, founders_per_startup)
+    """
+
+    def seed(count, founders_per_startup=0):
+        startups = [
+            Startup(
+                name=f"Startup {i}",
+                batch=f"W{20 + i % 4}",
+                source="YC",
+                industry="AI" if i % 2 else "Fintech",
+                founders=[
+                    Founder(name=f"Founder {i}-{j}", title="CEO")
+                    for j in range(founders_per_startup)
+                ],
+            )
+            for i in range(count)
+        ]
+        db.session.add_all(startups)
+        db.session.commit()
+        return startups
+
+    return seed
+
+
+@pytest.fixture
+def assert_max_queries(app):
+    """
+    Fail a block that executes more than `limit` SQL statements
+
+    Usage:
+        with assert_max_queries(2):
+            client.get("/api/startups?per_page=50")
+    """
+
+    def check(limit):
+        return query_counter.assert_max_queries(limit, db.engine)
+
+    return check
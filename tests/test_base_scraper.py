@@ -0,0 +1,124 @@
+import pytest
+
+from app.models.db import db
+from app.models.startup import Startup, Founder, year_from_batch
+from app.scrapers.base_scraper import BaseScraper
+
+
+class StubScraper(BaseScraper):
+    """Scraper that only persists the startups it is given"""
+
+    def __init__(self):
+        super().__init__()
+        self.source_name = "Neo"
+
+    def fetch_startups(self, year=None):
+        return []
+
+    def process_startup_data(self, raw_data):
+        return raw_data
+
+
+@pytest.fixture
+def scraper(app):
+    return StubScraper()
+
+
+def test_persist_inserts_new_startups(scraper):
+    scraper.persist(
+        [
+            {
+                "name": "Acme",
+                "year_founded": 2021,
+                "description": "Rockets",
+                "founders": [{"name": "Wile", "title": "CEO"}],
+            }
+        ]
+    )
+
+    startup = Startup.query.filter_by(name="Acme").one()
+    assert startup.year_founded == 2021
+    assert startup.description == "Rockets"
+    assert startup.source == "Neo"
+    assert startup.content_hash is not None
+    assert [(f.name, f.title) for f in startup.founders] == [("Wile", "CEO")]
+
+
+def test_persist_updates_only_supplied_columns(scraper):
+    scraper.persist(
+        [
+            {
+                "name": "Acme",
+                "year_founded": 2021,
+                "description": "Rockets",
+                "url": "https://acme.example",
+                "batch": "W21",
+            }
+        ]
+    )
+    scraper.persist([{"name": "Acme", "year_founded": 2021, "description": "Anvils"}])
+
+    startup = Startup.query.filter_by(name="Acme").one()
+    assert startup.description == "Anvils"
+    assert startup.url == "https://acme.example"
+    assert startup.batch == "W21"
+
+
+def test_persist_derives_missing_year_from_batch(scraper):
+    scraper.persist(
+        [
+            {"name": "Acme", "batch": "S19"},
+            {"name": "Globex", "batch": "W20", "year_founded": None},
+            {"name": "Initech"},
+        ]
+    )
+
+    years = dict(db.session.query(Startup.name, Startup.year_founded))
+    assert years == {"Acme": 2019, "Globex": 2020, "Initech": year_from_batch(None)}
+
+
+def test_persist_keeps_last_duplicate_of_a_chunk(scraper):
+    scraper.persist(
+        [
+            {"name": "Acme", "year_founded": 2021, "description": "First"},
+            {"name": "Acme", "year_founded": 2021, "description": "Second"},
+            {"name": "Acme", "year_founded": 2022, "description": "Other year"},
+        ]
+    )
+
+    rows = db.session.query(Startup.year_founded, Startup.description).order_by(
+        Startup.year_founded
+    )
+    assert rows.all() == [(2021, "Second"), (2022, "Other year")]
+
+
+def test_persist_updates_and_inserts_founders(scraper):
+    scraper.persist(
+        [
+            {
+                "name": "Acme",
+                "year_founded": 2021,
+                "founders": [{"name": "Wile", "title": "CEO"}],
+            }
+        ]
+    )
+    founder_id = Founder.query.filter_by(name="Wile").one().id
+
+    scraper.persist(
+        [
+            {
+                "name": "Acme",
+                "year_founded": 2021,
+                "founders": [
+                    {"name": "Wile", "title": "CTO"},
+                    {"name": "Road", "title": "CEO"},
+                ],
+            }
+        ]
+    )
+
+    founders = {f.name: f for f in Startup.query.filter_by(name="Acme").one().founders}
+    assert founders["Wile"].id == founder_id
+    assert founders["Wile"].title == "CTO"
+    assert founders["Road"].title == "CEO"
+    assert Founder.query.count() == 2
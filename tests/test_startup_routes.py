@@ -0,0 +1,49 @@
+import pytest
+
+from app.models.db import db
+from app.utils.query_counter import count_queries
+
+
+def test_list_startups_no_n_plus_one(client, seed_startups, assert_max_queries):
+    seed_startups(50, founders_per_startup=4)
+
+    # One query for the page and one for the founders of all its startups
+    with assert_max_queries(2):
+        response = client.get("/api/startups?per_page=50")
+
+    assert response.status_code == 200
+    startups = response.get_json()["startups"]
+    assert len(startups) == 50
+    assert sum(len(startup["founders"]) for startup in startups) == 200
+
+
+@pytest.mark.parametrize(
+    "url, limit",
+    [
+        ("/api/startups?per_page=50", 2),
+        ("/api/startups?per_page=50&with_count=true", 3),
+        ("/api/startups?year=2021&industry=AI", 2),
+        ("/api/years/2021?per_page=50", 2),
+        ("/api/years", 1),
+    ],
+)
+def test_route_query_counts(client, seed_startups, url, limit):
+    seed_startups(20, founders_per_startup=3)
+
+    with count_queries(db.engine) as queries:
+        response = client.get(url)
+
+    assert response.status_code == 200
+    assert len(queries) <= limit, "\n".join(queries)
+
+
+def test_get_startup_query_count(client, seed_startups):
+    startup = seed_startups(1, founders_per_startup=3)[0]
+
+    # The startup, then its founders through the selectin relationship
+    with count_queries(db.engine) as queries:
+        response = client.get(f"/api/startups/{startup.id}")
+
+    assert response.status_code == 200
+    assert len(response.get_json()["founders"]) == 3
+    assert len(queries) <= 2, "\n".join(queries)